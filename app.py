@@ -2,15 +2,40 @@ import streamlit as st
 import requests
 import base64
 from audio_recorder_streamlit import audio_recorder
+from google.auth.transport.requests import Request as GoogleAuthRequest
 from google.oauth2 import service_account
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload
+from googleapiclient import discovery_cache
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import V2_DISCOVERY_URI, build_from_document, fix_method_name
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaIoBaseDownload, build_http
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timezone
 import json
+import mimetypes
 import os
+import random
+import hashlib
+import hmac
+import html
 import io
+import mmap
+import queue
+import secrets
+import shutil
 import re
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import uuid
+import wave
+from array import array
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import config  # Import our configuration
 
 # =========================
@@ -272,96 +297,788 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# =========================
+# CACHE REGISTRY
+# =========================
+@st.cache_resource
+def get_cache_registry():
+    """Process-wide versions of named caches, keyed by credentials or file ID"""
+    return {"lock": threading.Lock(), "versions": {}}
+
+def cache_version(name, key):
+    """Return the current version of one entry in a named cache"""
+    return get_cache_registry()["versions"].get((name, key), 0)
+
+def invalidate_cache(name, key):
+    """Invalidate one keyed entry of a named cache, leaving every other cache warm"""
+    registry = get_cache_registry()
+    with registry["lock"]:
+        registry["versions"][(name, key)] = registry["versions"].get((name, key), 0) + 1
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one execution whose result they share"""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = {}  # key -> Future
+    
+    def do(self, key, fn):
+        with self.lock:
+            future = self.calls.get(key)
+            leader = future is None
+            if leader:
+                future = self.calls[key] = Future()
+        
+        if not leader:
+            return future.result()
+        
+        try:
+            future.set_result(fn())
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            with self.lock:
+                del self.calls[key]
+        return future.result()
+
+@st.cache_resource
+def get_single_flight():
+    """Process-wide single-flight group shared by every session and background thread"""
+    return SingleFlight()
+
+# =========================
+# GOOGLE API SCHEDULER
+# =========================
+# Lanes in priority order: "interactive" is what a user is waiting on,
+# "bulk" is background work such as mirror syncs and transcript backfills
+API_LANES = ("interactive", "bulk")
+RATE_LIMIT_REASONS = (b'rateLimitExceeded', b'userRateLimitExceeded')
+
+class TokenBucket:
+    """Refill `rate` tokens per second up to `capacity`; not thread-safe on its own"""
+    
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+    
+    def take(self, cost, reserve=0):
+        """Take `cost` tokens while leaving `reserve` behind; return 0, or the seconds to wait"""
+        now = time.monotonic()
+        if now > self.paused_until:
+            elapsed = now - max(self.updated, self.paused_until)
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated = now
+        
+        cost = min(cost, self.capacity)
+        needed = min(cost + reserve, self.capacity)
+        if self.tokens >= needed:
+            self.tokens -= cost
+            return 0
+        return max(self.paused_until - now, 0) + (needed - self.tokens) / self.rate
+    
+    def pause(self, seconds):
+        """Drain the bucket and stop refilling it for `seconds`"""
+        self.tokens = 0
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+def is_retryable_api_error(error, idempotent=True):
+    """Whether a Google API error is quota pressure (always retryable) or a transient outage of an idempotent call"""
+    status = error.resp.status
+    if status == 429 or (status == 403 and any(reason in error.content for reason in RATE_LIMIT_REASONS)):
+        return True
+    return idempotent and status in config.GOOGLE_API_RETRY_STATUSES
+
+def api_backoff(attempt, error):
+    """Seconds to wait before a retry: exponential with full jitter, or Retry-After"""
+    retry_after = error.resp.get('retry-after')
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), config.GOOGLE_API_BACKOFF_MAX)
+    return random.uniform(0, min(config.GOOGLE_API_BACKOFF_MAX, config.GOOGLE_API_BACKOFF_BASE * 2 ** attempt))
+
+class GoogleApiScheduler:
+    """Run every Google API call through per-API token buckets, with interactive calls ahead of bulk ones"""
+    
+    def __init__(self, quotas, bulk_reserve):
+        self.cond = threading.Condition()
+        self.buckets = {
+            api: TokenBucket(per_minute / 60, burst)
+            for api, (per_minute, burst) in quotas.items()
+        }
+        self.bulk_reserve = bulk_reserve
+        self.queued = {api: 0 for api in quotas}  # interactive calls waiting per API
+        self.throttled = {api: 0 for api in quotas}
+    
+    def acquire(self, api, lane, cost=1):
+        """Block until the call may go out under the API's quota"""
+        bucket = self.buckets[api]
+        interactive = lane == API_LANES[0]
+        reserve = 0 if interactive else bucket.capacity * self.bulk_reserve
+        with self.cond:
+            if interactive:
+                self.queued[api] += 1
+            try:
+                while True:
+                    wait = bucket.take(cost, reserve) if interactive or not self.queued[api] else None
+                    if wait == 0:
+                        return
+                    self.cond.wait(wait)
+            finally:
+                if interactive:
+                    self.queued[api] -= 1
+                self.cond.notify_all()
+    
+    def run(self, fn, api, lane="interactive", cost=1, idempotent=True):
+        """Call `fn` (one HTTP request's worth of `cost`), retrying quota and transient errors"""
+        if lane == API_LANES[0]:
+            max_retries = config.GOOGLE_API_MAX_RETRIES
+        else:
+            max_retries = config.GOOGLE_API_BULK_MAX_RETRIES
+        
+        attempt = 0
+        while True:
+            self.acquire(api, lane, cost)
+            try:
+                return fn()
+            except HttpError as e:
+                if attempt >= max_retries or not is_retryable_api_error(e, idempotent):
+                    raise
+                with self.cond:
+                    self.throttled[api] += 1
+                    self.buckets[api].pause(api_backoff(attempt, e))
+                attempt += 1
+
+@st.cache_resource
+def get_api_scheduler():
+    """Process-wide scheduler shared by every session and background thread"""
+    return GoogleApiScheduler(config.GOOGLE_API_QUOTAS, config.GOOGLE_API_BULK_RESERVE)
+
+def execute_request(request, api, lane="interactive", cost=1, idempotent=True):
+    """Execute a googleapiclient request through the scheduler (raises on API errors)"""
+    return get_api_scheduler().run(request.execute, api, lane, cost, idempotent)
+
 # =========================
 # GOOGLE API SETUP
 # =========================
-@st.cache_resource(ttl=config.CACHE_TTL)
-def get_google_services_from_file():
-    """Initialize Google Sheets and Drive services from file"""
-    try:
-        if os.path.exists(config.SERVICE_ACCOUNT_FILE):
-            credentials = service_account.Credentials.from_service_account_file(
-                config.SERVICE_ACCOUNT_FILE,
-                scopes=config.GOOGLE_SCOPES
-            )
-            sheets_service = build('sheets', 'v4', credentials=credentials)
-            drive_service = build('drive', 'v3', credentials=credentials)
-            return sheets_service, drive_service
-    except Exception as e:
-        st.error(f"Error loading service account from file: {e}")
-    return None, None
+# Discovery versions of the APIs the app talks to
+GOOGLE_APIS = {"sheets": "v4", "drive": "v3"}
+
+@st.cache_resource
+def get_discovery_document(api, version):
+    """Return an API's discovery document, saved under config.DISCOVERY_CACHE_DIR on first use"""
+    path = os.path.join(config.DISCOVERY_CACHE_DIR, f"{api}.{version}.json")
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    
+    document = discovery_cache.get_static_doc(api, version)
+    if document is None:
+        response = requests.get(V2_DISCOVERY_URI.format(api=api, apiVersion=version), timeout=config.REQUEST_TIMEOUT)
+        response.raise_for_status()
+        document = response.text
+    
+    os.makedirs(config.DISCOVERY_CACHE_DIR, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=config.DISCOVERY_CACHE_DIR, delete=False) as f:
+        f.write(document)
+    os.replace(f.name, path)
+    return document
+
+class HttpTransportPool:
+    """Bounded pool of authorized keep-alive connections, each borrowed for one call (httplib2 is not thread-safe)"""
+    
+    def __init__(self, credentials, size):
+        self.credentials = credentials  # read by googleapiclient for batches and universe checks
+        self.slots = threading.BoundedSemaphore(size)
+        self.idle = queue.LifoQueue()  # most recently used first, so warm sockets are reused
+    
+    def request(self, *args, **kwargs):
+        """httplib2.Http.request on a borrowed connection"""
+        with self.slots:
+            try:
+                http = self.idle.get_nowait()
+            except queue.Empty:
+                http = AuthorizedHttp(self.credentials, http=build_http())
+            response = http.request(*args, **kwargs)
+            self.idle.put(http)
+            return response
+    
+    def close(self):
+        """Close every idle connection"""
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+def warm_resources(resource, description):
+    """Create every method of a client once, so threads sharing it never race on the in-place discovery fix-ups"""
+    for name, child in description.get("resources", {}).items():
+        warm_resources(getattr(resource, fix_method_name(name))(), child)
+
+class GoogleClients:
+    """Sheets and Drive clients for one credential identity, with the token refreshed ahead of expiry"""
+    
+    def __init__(self, credentials):
+        self.credentials = credentials
+        self.transport = HttpTransportPool(credentials, config.GOOGLE_HTTP_POOL_SIZE)
+        self.auth_request = GoogleAuthRequest()
+        self.refresh_lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.last_error = None
+        self.refresh()
+        self.sheets_service = self.build("sheets")
+        self.drive_service = self.build("drive")
+        threading.Thread(target=self._keep_fresh, name="token-refresh", daemon=True).start()
+    
+    def build(self, api):
+        """Build a client on the shared transport from the cached discovery document"""
+        description = json.loads(get_discovery_document(api, GOOGLE_APIS[api]))
+        service = build_from_document(description, http=self.transport)
+        warm_resources(service, description)
+        return service
+    
+    def refresh(self):
+        """Mint a new access token now; returns False (keeping the error) on failure"""
+        try:
+            with self.refresh_lock:
+                self.credentials.refresh(self.auth_request)
+        except Exception as e:
+            self.last_error = str(e)
+            return False
+        self.last_error = None
+        return True
+    
+    def seconds_until_refresh(self):
+        expiry = self.credentials.expiry
+        if expiry is None:
+            return 0
+        # google-auth keeps expiry as a naive UTC datetime
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return (expiry - now).total_seconds() - config.TOKEN_REFRESH_MARGIN
+    
+    def _keep_fresh(self):
+        while not self.stop_event.wait(max(self.seconds_until_refresh(), config.TOKEN_REFRESH_RETRY)):
+            self.refresh()
+    
+    def stop(self):
+        self.stop_event.set()
+        self.transport.close()
+
+class GoogleClientRegistry:
+    """Process-wide GoogleClients per credentials key, rebuilt only when the credentials version changes"""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.clients = {}  # credentials_key -> (version, GoogleClients)
+    
+    def get(self, credentials_key, version, load_credentials):
+        """Return the clients for a credentials version, or None when there are no credentials"""
+        with self.lock:
+            entry = self.clients.get(credentials_key)
+            if entry and entry[0] == version:
+                return entry[1]
+            
+            credentials = load_credentials()
+            if credentials is None:
+                return None
+            if entry:
+                entry[1].stop()
+            clients = GoogleClients(credentials)
+            self.clients[credentials_key] = (version, clients)
+            return clients
+    
+    def discard(self, credentials_key):
+        """Drop a credentials key's clients and stop refreshing its token"""
+        with self.lock:
+            entry = self.clients.pop(credentials_key, None)
+        if entry:
+            entry[1].stop()
 
-@st.cache_resource(ttl=config.CACHE_TTL)
-def get_google_services_from_dict(_credentials_dict):
-    """Initialize Google Sheets and Drive services from uploaded JSON"""
+@st.cache_resource
+def get_client_registry():
+    return GoogleClientRegistry()
+
+def get_google_clients():
+    """Long-lived clients for the active credentials, or None when not connected"""
+    credentials_key = get_credentials_key()
     try:
-        credentials = service_account.Credentials.from_service_account_info(
-            _credentials_dict,
-            scopes=config.GOOGLE_SCOPES
+        return get_client_registry().get(
+            credentials_key, cache_version("google_services", credentials_key), load_google_credentials
         )
-        sheets_service = build('sheets', 'v4', credentials=credentials)
-        drive_service = build('drive', 'v3', credentials=credentials)
-        return sheets_service, drive_service
     except Exception as e:
-        st.error(f"Error loading service account from uploaded file: {e}")
-        return None, None
+        st.error(f"Error loading service account credentials: {e}")
+        return None
 
 def get_google_services():
     """Get Google services from session state, uploaded file, or local file"""
-    # Check if we have credentials in session state (from upload)
-    if 'google_credentials' in st.session_state and st.session_state.google_credentials:
-        return get_google_services_from_dict(st.session_state.google_credentials)
-    
-    # Otherwise try to load from file
-    return get_google_services_from_file()
+    clients = get_google_clients()
+    if clients is None:
+        return None, None
+    return clients.sheets_service, clients.drive_service
+
+def load_google_credentials():
+    """Load service account credentials from the session upload or the local file"""
+    credentials_dict = st.session_state.get('google_credentials')
+    if credentials_dict:
+        return service_account.Credentials.from_service_account_info(
+            credentials_dict,
+            scopes=config.GOOGLE_SCOPES
+        )
+    if os.path.exists(config.SERVICE_ACCOUNT_FILE):
+        return service_account.Credentials.from_service_account_file(
+            config.SERVICE_ACCOUNT_FILE,
+            scopes=config.GOOGLE_SCOPES
+        )
+    return None
+
+def get_credentials_key():
+    """Identify the active credentials so cached data never leaks across accounts"""
+    credentials_dict = st.session_state.get('google_credentials')
+    if credentials_dict:
+        # The key ID alone can be copied into a forged file; the key itself cannot
+        key_hash = hashlib.sha256(str(credentials_dict.get('private_key', '')).encode()).hexdigest()[:16]
+        return f"upload:{credentials_dict.get('client_email')}:{credentials_dict.get('private_key_id')}:{key_hash}"
+    return f"file:{config.SERVICE_ACCOUNT_FILE}"
 
 # =========================
 # AUDIO PLAYBACK FUNCTIONS
 # =========================
+# Checked in order; the last one accepts a bare file ID
+DRIVE_FILE_ID_PATTERNS = [
+    r'/file/d/([a-zA-Z0-9_-]+)',   # /file/d/FILE_ID/view
+    r'/document/d/([a-zA-Z0-9_-]+)',  # Google Docs transcript links
+    r'[?&]id=([a-zA-Z0-9_-]+)',    # id=FILE_ID and /open?id=FILE_ID
+    r'^\s*([a-zA-Z0-9_-]+)\s*$',   # direct file ID
+]
+
 def extract_drive_file_id(drive_link):
     """Extract file ID from various Google Drive URL formats"""
     if not drive_link or not drive_link.strip():
         return None
     
-    # Pattern 1: /file/d/FILE_ID/view
-    match = re.search(r'/file/d/([a-zA-Z0-9_-]+)', drive_link)
-    if match:
-        return match.group(1)
-    
-    # Pattern 2: id=FILE_ID
-    match = re.search(r'[?&]id=([a-zA-Z0-9_-]+)', drive_link)
-    if match:
-        return match.group(1)
-    
-    # Pattern 3: /open?id=FILE_ID
-    match = re.search(r'/open\?id=([a-zA-Z0-9_-]+)', drive_link)
-    if match:
-        return match.group(1)
-    
-    # Pattern 4: direct file ID (if just the ID is provided)
-    if re.match(r'^[a-zA-Z0-9_-]+$', drive_link.strip()):
-        return drive_link.strip()
+    for pattern in DRIVE_FILE_ID_PATTERNS:
+        match = re.search(pattern, drive_link)
+        if match:
+            return match.group(1)
     
     return None
 
-@st.cache_data(ttl=3600)
-def get_audio_from_drive(_drive_service, file_id):
-    """Download audio file from Google Drive and return as bytes"""
+def extract_drive_file_ids(drive_links):
+    """Vectorized extract_drive_file_id over a Series of Drive links"""
+    drive_links = drive_links.astype(str)
+    file_ids = pd.Series(None, index=drive_links.index, dtype=object)
+    for pattern in DRIVE_FILE_ID_PATTERNS:
+        file_ids = file_ids.fillna(drive_links.str.extract(pattern, expand=False))
+    return file_ids
+
+class AudioDiskCache:
+    """Size-bounded LRU cache of Drive audio files on local disk, keyed by file ID and shared by every account"""
+    
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # file_id -> size, least recently used first
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.bytes_evicted = 0
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+    
+    def _path(self, file_id):
+        return os.path.join(self.directory, f"{file_id}.audio")
+    
+    def _load_index(self):
+        """Rebuild LRU order from file mtimes so warm files survive restarts"""
+        found = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.endswith('.tmp'):
+                # Leftover from a download interrupted before its atomic rename
+                os.remove(path)
+            elif name.endswith('.audio'):
+                stat = os.stat(path)
+                found.append((stat.st_mtime, name[:-len('.audio')], stat.st_size))
+        
+        for _, file_id, size in sorted(found):
+            self.entries[file_id] = size
+            self.bytes_used += size
+        self._evict(0)
+    
+    def _evict(self, incoming_bytes):
+        """Drop least recently used files until incoming_bytes fits the budget"""
+        while self.entries and self.bytes_used + incoming_bytes > self.max_bytes:
+            file_id, size = self.entries.popitem(last=False)
+            try:
+                os.remove(self._path(file_id))
+            except FileNotFoundError:
+                pass
+            self.bytes_used -= size
+            self.bytes_evicted += size
+    
+    def _map(self, file_id):
+        with open(self._path(file_id), 'rb') as fh:
+            if self.entries[file_id] == 0:
+                return b""
+            return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    def open(self, file_id, count=True):
+        """Return a read-only memory map of a cached file, or None on a miss"""
+        with self.lock:
+            if file_id not in self.entries:
+                self.misses += count
+                return None
+            self.hits += count
+            self.entries.move_to_end(file_id)
+            os.utime(self._path(file_id))
+            return self._map(file_id)
+    
+    def store(self, file_id, write_fn):
+        """Write a file through write_fn(file_obj), publish it atomically and map it"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fh:
+                write_fn(fh)
+                fh.flush()
+                os.fsync(fh.fileno())
+            size = os.path.getsize(tmp_path)
+            
+            with self.lock:
+                if file_id in self.entries:
+                    self.bytes_used -= self.entries.pop(file_id)
+                self._evict(size)
+                os.replace(tmp_path, self._path(file_id))
+                self.entries[file_id] = size
+                self.bytes_used += size
+                return self._map(file_id)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def stats(self):
+        """Return hit/miss/eviction counters and current usage"""
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "bytes_evicted": self.bytes_evicted,
+                "bytes_used": self.bytes_used,
+                "files": len(self.entries),
+            }
+
+@st.cache_resource
+def get_audio_cache():
+    """Process-wide on-disk audio cache shared by every session"""
+    return AudioDiskCache(config.AUDIO_CACHE_DIR, config.AUDIO_CACHE_MAX_BYTES)
+
+def get_audio_from_drive(drive_service, file_id):
+    """Return a Drive audio file as a read-only memory map, downloading it on a cache miss"""
+    cache = get_audio_cache()
+    credentials_key = get_credentials_key()
     try:
-        request = _drive_service.files().get_media(fileId=file_id)
-        file_buffer = io.BytesIO()
-        downloader = MediaIoBaseDownload(file_buffer, request)
+        # The disk cache is shared by every account, so only serve it to credentials that can read the file
+        verified = has_drive_access(drive_service, credentials_key, file_id)
+        audio = cache.open(file_id) if verified else None
+        if audio is not None:
+            return audio
         
-        done = False
-        while not done:
-            status, done = downloader.next_chunk()
+        def download(file_obj):
+            request = drive_service.files().get_media(fileId=file_id)
+            downloader = MediaIoBaseDownload(file_obj, request)
+            done = False
+            while not done:
+                status, done = get_api_scheduler().run(downloader.next_chunk, "drive")
         
-        file_buffer.seek(0)
-        return file_buffer.read()
+        # Sessions asking for the same file at once share a single download
+        return get_single_flight().do(
+            ("drive_media", credentials_key, file_id),
+            lambda: (verified and cache.open(file_id, count=False)) or cache.store(file_id, download)
+        )
     except Exception as e:
         st.error(f"Error downloading audio from Drive: {e}")
         return None
 
+# =========================
+# DRIVE METADATA
+# =========================
+DRIVE_METADATA_FIELDS = 'id,size,mimeType,modifiedTime,videoMediaMetadata(durationMillis)'
+DRIVE_BATCH_SIZE = 100  # Drive's limit on calls per batch request
+
+class DriveMetadataCache:
+    """Process-wide Drive metadata per (credentials_key, file_id), filled by batched files.get calls and kept `ttl` seconds"""
+    
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.entries = {}  # (credentials_key, file_id) -> (fetched_at, metadata)
+    
+    def get(self, credentials_key, file_id):
+        """Return cached metadata, or None when missing or expired"""
+        with self.lock:
+            entry = self.entries.get((credentials_key, file_id))
+        if entry and time.time() - entry[0] < self.ttl:
+            return entry[1]
+        return None
+    
+    def fetch(self, drive_service, credentials_key, file_ids):
+        """Return {file_id: metadata}, fetching uncached IDs up to 100 per HTTP request"""
+        result, missing = {}, []
+        for file_id in dict.fromkeys(file_ids):
+            if not isinstance(file_id, str) or not file_id:
+                continue
+            metadata = self.get(credentials_key, file_id)
+            if metadata is None:
+                missing.append(file_id)
+            else:
+                result[file_id] = metadata
+        
+        for start in range(0, len(missing), DRIVE_BATCH_SIZE):
+            chunk = tuple(missing[start:start + DRIVE_BATCH_SIZE])
+            # Sessions showing the same page at once share one batch request
+            result.update(get_single_flight().do(
+                ("drive_metadata", credentials_key, chunk),
+                lambda: self._fetch_batch(drive_service, credentials_key, chunk)
+            ))
+        return result
+    
+    def _fetch_batch(self, drive_service, credentials_key, file_ids):
+        fetched = {}
+        pending = list(file_ids)
+        throttled = []  # (file_id, error) for items the last batch should retry
+        
+        def on_response(request_id, response, exception):
+            if exception is None:
+                fetched[request_id] = response
+            elif isinstance(exception, HttpError) and is_retryable_api_error(exception):
+                throttled.append((request_id, exception))
+            elif isinstance(exception, HttpError) and exception.resp.status in (403, 404):
+                fetched[request_id] = {}
+        
+        def execute_pending():
+            throttled.clear()
+            batch = drive_service.new_batch_http_request(callback=on_response)
+            for file_id in pending:
+                batch.add(drive_service.files().get(fileId=file_id, fields=DRIVE_METADATA_FIELDS), request_id=file_id)
+            batch.execute()
+            pending[:] = [file_id for file_id, _ in throttled]
+            if throttled:
+                # Let the scheduler back off the drive bucket, then re-send only these items
+                raise throttled[0][1]
+        
+        try:
+            get_api_scheduler().run(execute_pending, "drive", cost=len(file_ids))
+        except HttpError as e:
+            # Items still throttled after the retry budget are left uncached for the next rerun
+            if not throttled or e is not throttled[0][1]:
+                raise
+        
+        now = time.time()
+        with self.lock:
+            for file_id, metadata in fetched.items():
+                self.entries[(credentials_key, file_id)] = (now, metadata)
+        return fetched
+
+@st.cache_resource
+def get_drive_metadata_cache():
+    """Process-wide Drive metadata cache shared by every session"""
+    return DriveMetadataCache(config.DRIVE_METADATA_TTL)
+
+def get_drive_metadata(drive_service, file_ids):
+    """Return {file_id: metadata} for the given files, batching whatever is not cached"""
+    if not drive_service:
+        return {}
+    try:
+        return get_drive_metadata_cache().fetch(drive_service, get_credentials_key(), file_ids)
+    except Exception as e:
+        st.caption(f"⚠️ Could not load Drive file details: {e}")
+        return {}
+
+def has_drive_access(drive_service, credentials_key, file_id):
+    """Whether these credentials can read a Drive file, answered from the metadata cache when possible"""
+    try:
+        return bool(get_drive_metadata_cache().fetch(drive_service, credentials_key, [file_id]).get(file_id))
+    except Exception:
+        return False
+
+def audio_format(metadata, drive_link=""):
+    """Pick the player MIME type from Drive metadata, falling back to the file name"""
+    mime_type = (metadata or {}).get('mimeType', '')
+    if mime_type.startswith(('audio/', 'video/')):
+        return mime_type
+    return mimetypes.guess_type(drive_link)[0] or 'audio/wav'
+
+def describe_drive_file(metadata):
+    """One-line size · format · duration summary of a Drive file, or '' if unknown"""
+    if not metadata:
+        return ""
+    parts = []
+    if metadata.get('size'):
+        size = int(metadata['size'])
+        parts.append(f"💾 {size / (1024 * 1024):.1f} MB" if size >= 1024 * 1024 else f"💾 {size / 1024:.0f} KB")
+    if metadata.get('mimeType'):
+        parts.append(f"🎼 {metadata['mimeType'].split('/')[-1].upper()}")
+    duration_millis = metadata.get('videoMediaMetadata', {}).get('durationMillis')
+    if duration_millis:
+        minutes, seconds = divmod(int(duration_millis) // 1000, 60)
+        hours, minutes = divmod(minutes, 60)
+        parts.append(f"⏱️ {hours}:{minutes:02d}:{seconds:02d}" if hours else f"⏱️ {minutes}:{seconds:02d}")
+    if metadata.get('modifiedTime'):
+        parts.append(f"🕒 {metadata['modifiedTime'][:10]}")
+    return " · ".join(parts)
+
+def cached_drive_file_summary(file_id):
+    """describe_drive_file for an already fetched file, without any API call"""
+    if not isinstance(file_id, str):
+        return ""
+    return describe_drive_file(get_drive_metadata_cache().get(get_credentials_key(), file_id))
+
+# =========================
+# AUDIO STREAMING PROXY
+# =========================
+def parse_range_header(range_header, size):
+    """Parse a single 'bytes=' Range header into an inclusive (start, end) pair"""
+    if not range_header or not range_header.startswith('bytes=') or ',' in range_header:
+        return None
+    
+    start_text, _, end_text = range_header[len('bytes='):].strip().partition('-')
+    if start_text:
+        start = int(start_text)
+        end = min(int(end_text), size - 1) if end_text else size - 1
+    else:
+        # Suffix range: the last N bytes
+        start = max(size - int(end_text), 0)
+        end = size - 1
+    
+    if start > end or start >= size:
+        raise ValueError("Unsatisfiable range")
+    return start, end
+
+class AudioStreamHandler(BaseHTTPRequestHandler):
+    """Answer browser Range requests for registered Drive audio files"""
+    
+    def do_HEAD(self):
+        self._serve(send_body=False)
+    
+    def do_GET(self):
+        self._serve(send_body=True)
+    
+    def log_message(self, format, *args):
+        pass
+    
+    def _serve(self, send_body):
+        token = self.path.split('?', 1)[0].rstrip('/').rsplit('/', 1)[-1]
+        entry = self.server.lookup(token)
+        if entry is None:
+            self.send_error(404, "Unknown audio token")
+            return
+        
+        drive_service, file_id, credentials_key = entry
+        try:
+            size, mime_type = self.server.file_info(drive_service, file_id, credentials_key)
+        except Exception as e:
+            self.send_error(502, f"Drive lookup failed: {e}")
+            return
+        
+        try:
+            byte_range = parse_range_header(self.headers.get('Range'), size)
+        except ValueError:
+            self.send_response(416)
+            self.send_header('Content-Range', f'bytes */{size}')
+            self.end_headers()
+            return
+        
+        start, end = byte_range if byte_range else (0, size - 1)
+        self.send_response(206 if byte_range else 200)
+        self.send_header('Content-Type', mime_type)
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('Content-Length', str(end - start + 1))
+        self.send_header('Cache-Control', 'private, max-age=3600')
+        if byte_range:
+            self.send_header('Content-Range', f'bytes {start}-{end}/{size}')
+        self.end_headers()
+        
+        if not send_body or size == 0:
+            return
+        
+        try:
+            for chunk in self.server.iter_bytes(drive_service, file_id, credentials_key, start, end):
+                self.wfile.write(chunk)
+        except (BrokenPipeError, ConnectionResetError):
+            # The browser dropped the connection, e.g. after seeking elsewhere
+            pass
+
+class AudioStreamServer(ThreadingHTTPServer):
+    """Local HTTP endpoint streaming Drive audio in bounded chunks"""
+    
+    daemon_threads = True
+    max_tokens = 1000
+    
+    def __init__(self, address):
+        super().__init__(address, AudioStreamHandler)
+        self.secret = secrets.token_bytes(32)
+        self.lock = threading.Lock()
+        self.tokens = OrderedDict()  # token -> (drive_service, file_id, credentials_key)
+        self.info = {}  # (credentials_key, file_id) -> (size, mime_type)
+    
+    def register(self, drive_service, file_id, credentials_key):
+        """Expose a Drive file and return its stable streaming URL"""
+        message = f"{credentials_key}:{file_id}".encode()
+        token = hmac.new(self.secret, message, hashlib.sha256).hexdigest()[:32]
+        with self.lock:
+            self.tokens[token] = (drive_service, file_id, credentials_key)
+            self.tokens.move_to_end(token)
+            while len(self.tokens) > self.max_tokens:
+                self.tokens.popitem(last=False)
+        return f"{config.AUDIO_STREAM_PUBLIC_URL.rstrip('/')}/audio/{token}"
+    
+    def lookup(self, token):
+        with self.lock:
+            return self.tokens.get(token)
+    
+    def file_info(self, drive_service, file_id, credentials_key):
+        """Return (size, mime_type) from Drive metadata, never from the media itself"""
+        if (credentials_key, file_id) not in self.info:
+            metadata = execute_request(
+                drive_service.files().get(fileId=file_id, fields='size,mimeType'), "drive"
+            )
+            self.remember_info(file_id, credentials_key, metadata)
+        return self.info[(credentials_key, file_id)]
+    
+    def remember_info(self, file_id, credentials_key, metadata):
+        """Store Drive size/mimeType metadata fetched elsewhere, e.g. by the prefetcher"""
+        self.info[(credentials_key, file_id)] = (int(metadata.get('size', 0)), metadata.get('mimeType', 'audio/wav'))
+    
+    def iter_bytes(self, drive_service, file_id, credentials_key, start, end):
+        """Yield an inclusive byte range from the disk cache or ranged Drive reads"""
+        chunk_size = config.AUDIO_STREAM_CHUNK_BYTES
+        verified = has_drive_access(drive_service, credentials_key, file_id)
+        cached = get_audio_cache().open(file_id) if verified else None
+        
+        if cached is not None:
+            view = memoryview(cached)
+            for offset in range(start, end + 1, chunk_size):
+                yield view[offset:min(offset + chunk_size, end + 1)]
+            return
+        
+        for offset in range(start, end + 1, chunk_size):
+            request = drive_service.files().get_media(fileId=file_id)
+            request.headers['Range'] = f'bytes={offset}-{min(offset + chunk_size, end + 1) - 1}'
+            yield execute_request(request, "drive")
+
+@st.cache_resource
+def get_audio_stream_server():
+    """Start the streaming proxy once per process, or return None if it cannot bind"""
+    try:
+        server = AudioStreamServer((config.AUDIO_STREAM_HOST, config.AUDIO_STREAM_PORT))
+    except OSError as e:
+        st.error(f"Audio streaming proxy disabled: {e}")
+        return None
+    threading.Thread(target=server.serve_forever, name="audio-stream", daemon=True).start()
+    return server
+
 def play_audio_inline(drive_link, drive_service, title="Audio Playback"):
     """Display audio player inline for Google Drive audio file"""
     if not drive_link or not drive_link.strip():
@@ -375,129 +1092,1137 @@ def play_audio_inline(drive_link, drive_service, title="Audio Playback"):
         st.caption(f"Link: {drive_link}")
         return
     
+    metadata = get_drive_metadata(drive_service, [file_id]).get(file_id, {})
+    audio_mime = audio_format(metadata, drive_link)
+    
+    # The proxy is only useful when the browser can reach it at an explicitly configured URL
+    streaming = config.ENABLE_AUDIO_STREAMING and config.AUDIO_STREAM_PUBLIC_URL
+    stream_server = get_audio_stream_server() if streaming else None
+    if stream_server:
+        if metadata.get('size'):
+            stream_server.remember_info(file_id, get_credentials_key(), metadata)
+        st.markdown(f"""
+        <div class="audio-player-container">
+            <div class="audio-player-title">🎧 {title}</div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # The browser fetches byte ranges from the proxy, so playback starts immediately
+        stream_url = stream_server.register(drive_service, file_id, get_credentials_key())
+        st.audio(stream_url, format=audio_mime)
+        if metadata:
+            st.caption(describe_drive_file(metadata))
+        return
+    
     with st.spinner("🎵 Loading audio from Drive..."):
-        audio_bytes = get_audio_from_drive(drive_service, file_id)
+        audio_file = get_audio_from_drive(drive_service, file_id)
     
-    if audio_bytes:
+    if audio_file:
         st.markdown(f"""
         <div class="audio-player-container">
             <div class="audio-player-title">🎧 {title}</div>
         </div>
         """, unsafe_allow_html=True)
         
-        st.audio(audio_bytes, format='audio/wav')
+        # Streamlit's media manager keeps its own copy; the cached file stays mapped on disk
+        st.audio(bytes(audio_file), format=audio_mime)
         
         # Show audio info
-        size_mb = len(audio_bytes) / (1024 * 1024)
-        st.caption(f"📊 Audio size: {size_mb:.2f} MB")
+        st.caption(describe_drive_file(metadata) or f"📊 Audio size: {len(audio_file) / (1024 * 1024):.2f} MB")
     else:
         st.error("❌ Failed to load audio from Drive")
         st.info("💡 Make sure the file is shared with the service account")
 
+@st.fragment
+def play_audio_on_demand(drive_link, drive_service, title, key):
+    """Show a load button and only fetch audio from Drive once it is clicked (reruns this fragment only)"""
+    loaded_audio = st.session_state.loaded_audio
+    
+    if not config.LAZY_AUDIO_LOADING or key in loaded_audio:
+        play_audio_inline(drive_link, drive_service, title)
+        return
+    
+    if st.button("▶️ Load & Play", key=f"load_{key}", use_container_width=True):
+        loaded_audio.add(key)
+        play_audio_inline(drive_link, drive_service, title)
+
 # =========================
 # GOOGLE SHEETS FUNCTIONS (WITH CRUD)
 # =========================
+def read_sheet_values(sheets_service, lane="interactive"):
+    """Read the A2:H range as a list of rows padded to every column (raises on API errors)"""
+    result = execute_request(sheets_service.spreadsheets().values().get(
+        spreadsheetId=config.GOOGLE_SHEETS_ID,
+        range=f'{config.SHEET_NAME}!A2:H'
+    ), "sheets", lane)
+    
+    # Pad rows that have missing columns
+    max_cols = len(config.SHEET_HEADERS)
+    return [row + [''] * (max_cols - len(row)) for row in result.get('values', [])]
+
+def column_letter(index):
+    """Return the A1 column letter of a zero-based column index"""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+def header_column_spans(headers):
+    """Group headers into contiguous [(first, last)] column index spans"""
+    indexes = sorted(config.SHEET_HEADERS.index(header) for header in headers)
+    spans = []
+    for index in indexes:
+        if spans and spans[-1][1] == index - 1:
+            spans[-1][1] = index
+        else:
+            spans.append([index, index])
+    return spans
+
+def read_sheet_window(sheets_service, start_row, row_count, headers=None):
+    """Read rows [start_row, start_row + row_count) of the given headers, padded to every column (raises on API errors)"""
+    spans = header_column_spans(headers or config.SHEET_HEADERS)
+    end_row = start_row + row_count - 1
+    result = execute_request(sheets_service.spreadsheets().values().batchGet(
+        spreadsheetId=config.GOOGLE_SHEETS_ID,
+        ranges=[
+            f"{config.SHEET_NAME}!{column_letter(first)}{start_row}:{column_letter(last)}{end_row}"
+            for first, last in spans
+        ]
+    ), "sheets")
+    
+    rows = [[''] * len(config.SHEET_HEADERS) for _ in range(row_count)]
+    for (first, last), value_range in zip(spans, result.get('valueRanges', [])):
+        for row, cells in zip(rows, value_range.get('values', [])):
+            row[first:first + len(cells)] = cells[:last - first + 1]
+    
+    while rows and not any(rows[-1]):
+        rows.pop()
+    return rows
+
+def read_sheet_rows(sheets_service, row_numbers, headers):
+    """Read the given headers of scattered sheet rows in one values.batchGet; returns {row: cells}"""
+    spans = header_column_spans(headers)
+    runs = group_contiguous(sorted(row_numbers))
+    result = execute_request(sheets_service.spreadsheets().values().batchGet(
+        spreadsheetId=config.GOOGLE_SHEETS_ID,
+        ranges=[
+            f"{config.SHEET_NAME}!{column_letter(first)}{start}:{column_letter(last)}{end}"
+            for start, end in runs
+            for first, last in spans
+        ]
+    ), "sheets")
+    
+    rows = {number: [''] * len(config.SHEET_HEADERS) for number in row_numbers}
+    value_ranges = iter(result.get('valueRanges', []))
+    for start, end in runs:
+        for first, last in spans:
+            for number, cells in zip(range(start, end + 1), next(value_ranges, {}).get('values', [])):
+                rows[number][first:first + len(cells)] = cells[:last - first + 1]
+    return rows
+
+def parse_words(words):
+    """Parse word counts such as '1,234' into int32, treating blanks as 0"""
+    words = words.astype(str).str.replace(',', '', regex=False)
+    return pd.to_numeric(words, errors='coerce').fillna(0).astype('int32')
+
+def parse_timestamps(timestamps):
+    """Parse sheet timestamps into naive datetime64 (offsets converted to UTC), treating blanks and junk as NaT"""
+    parsed = pd.to_datetime(timestamps, errors='coerce', utc=True, format='mixed')
+    return parsed.dt.tz_convert(None)
+
+def parse_duration_seconds(durations):
+    """Parse 'HH:MM:SS', 'MM:SS' or plain second counts into int32 seconds"""
+    parts = durations.astype(str).str.strip().str.extract(
+        r'^(?:(?:(\d+):)?(\d+):)?(\d+(?:\.\d+)?)$'
+    ).astype(float).fillna(0)
+    return (parts[0] * 3600 + parts[1] * 60 + parts[2]).round().astype('int32')
+
+def record_keys(df):
+    """Stable per-recording keys (Drive file ID, else a hash of timestamp and title) for widgets and session state"""
+    fallback = (df['Timestamp'].astype(str) + '\x1f' + df['Title'].astype(str)).map(
+        lambda text: hashlib.sha1(text.encode()).hexdigest()[:16]
+    )
+    keys = df['File ID'].fillna(fallback).astype(str)
+    occurrence = keys.groupby(keys).cumcount()
+    return keys.where(occurrence == 0, keys + '-' + occurrence.astype(str))
+
+def build_recordings_frame(values, rows=None):
+    """Build the Recordings DataFrame from padded sheet rows, adding typed columns beside the raw text"""
+    df = pd.DataFrame(values or None, columns=config.SHEET_HEADERS)
+    # Add row index for reference
+    df['Row'] = rows if rows is not None else range(2, len(df) + 2)  # Starting from row 2 (after header)
+    
+    df['Word Count'] = parse_words(df['Words'])
+    df['Recorded At'] = parse_timestamps(df['Timestamp'])
+    df['Category'] = df['Category'].astype('category')
+    df['Duration Seconds'] = parse_duration_seconds(df['Duration'])
+    df['File ID'] = extract_drive_file_ids(df['Drive Link'])
+    df['Key'] = record_keys(df)
+    return df
+
 def read_sheets_data(sheets_service):
-    """Read all recordings from Google Sheets"""
+    """Read all recordings from Google Sheets (raises on API errors)"""
     if not sheets_service:
         return pd.DataFrame()
     
-    try:
-        result = sheets_service.spreadsheets().values().get(
-            spreadsheetId=config.GOOGLE_SHEETS_ID,
-            range=f'{config.SHEET_NAME}!A2:H'
-        ).execute()
-        values = result.get('values', [])
+    return build_recordings_frame(read_sheet_values(sheets_service))
+
+@st.cache_data(ttl=config.CACHE_TTL, show_spinner=False)
+def get_sheet_row_count(_sheets_service, spreadsheet_id, credentials_key, version):
+    """Upper bound on the data rows below the header, from the tab's grid metadata"""
+    metadata = execute_request(_sheets_service.spreadsheets().get(
+        spreadsheetId=spreadsheet_id,
+        fields='sheets.properties(title,gridProperties.rowCount)'
+    ), "sheets")
+    
+    sheets = metadata['sheets']
+    properties = next(
+        (sheet['properties'] for sheet in sheets if sheet['properties']['title'] == config.SHEET_NAME),
+        sheets[0]['properties']
+    )
+    return max(properties['gridProperties']['rowCount'] - 1, 0)
+
+@st.cache_data(ttl=config.CACHE_TTL, show_spinner=False)
+def get_sheet_id(_sheets_service, spreadsheet_id, credentials_key):
+    """Look up the numeric sheetId of the config.SHEET_NAME tab"""
+    metadata = execute_request(_sheets_service.spreadsheets().get(
+        spreadsheetId=spreadsheet_id,
+        fields='sheets.properties'
+    ), "sheets")
+    
+    for sheet in metadata['sheets']:
+        if sheet['properties']['title'] == config.SHEET_NAME:
+            return sheet['properties']['sheetId']
+    return metadata['sheets'][0]['properties']['sheetId']
+
+# Cells that tell recordings apart when checking a row still holds the one that was read
+ROW_IDENTITY_HEADERS = ('Timestamp', 'Title', 'Drive Link')
+
+def sheet_row_values(row):
+    """Return a recording's cells in sheet column order"""
+    return [row.get(header, '') for header in config.SHEET_HEADERS]
+
+def group_contiguous(numbers):
+    """Group sorted integers into inclusive (first, last) runs"""
+    runs = []
+    for number in numbers:
+        if runs and number == runs[-1][1] + 1:
+            runs[-1][1] = number
+        else:
+            runs.append([number, number])
+    return [tuple(run) for run in runs]
+
+class SheetMutationBatch:
+    """Collect row edits and deletes and flush them in a single batchUpdate"""
+    
+    def __init__(self, sheets_service):
+        self.sheets_service = sheets_service
+        self.updates = {}  # row_number -> {column_index: value}
+        self.deletes = set()
+        self.expected = {}  # row_number -> identity cells the row held when it was read
+    
+    def expect(self, row_number, old_values):
+        """Remember which recording a row held, so a shifted sheet is caught before the flush"""
+        if old_values and any(value is not None for value in old_values):
+            cells = [old_values[config.SHEET_HEADERS.index(header)] for header in ROW_IDENTITY_HEADERS]
+            self.expected[row_number] = ['' if pd.isna(cell) else str(cell) for cell in cells]
+    
+    def update(self, row_number, old_values, new_values):
+        """Queue only the cells of a row whose value changed"""
+        # Row numbers read from a DataFrame are numpy ints, which neither JSON nor sqlite accept
+        row_number = int(row_number)
+        if row_number in self.deletes:
+            return
+        self.expect(row_number, old_values)
+        for column, (old, new) in enumerate(zip(old_values, new_values)):
+            if str(old) != str(new):
+                self.updates.setdefault(row_number, {})[column] = new
+    
+    def delete(self, row_number, old_values=None):
+        """Queue a row for deletion, dropping any pending edits to it"""
+        row_number = int(row_number)
+        self.expect(row_number, old_values)
+        self.deletes.add(row_number)
+        self.updates.pop(row_number, None)
+    
+    def build_requests(self, sheet_id):
+        """Translate pending mutations into batchUpdate requests"""
+        requests_body = []
         
-        if not values:
-            return pd.DataFrame(columns=config.SHEET_HEADERS)
+        # Edits go first so their row numbers are not shifted by the deletes
+        for row_number, cells in sorted(self.updates.items()):
+            for first, last in group_contiguous(sorted(cells)):
+                requests_body.append({
+                    'updateCells': {
+                        'start': {'sheetId': sheet_id, 'rowIndex': row_number - 1, 'columnIndex': first},
+                        'rows': [{'values': [
+                            {'userEnteredValue': {'stringValue': str(cells[column])}}
+                            for column in range(first, last + 1)
+                        ]}],
+                        'fields': 'userEnteredValue',
+                    }
+                })
         
-        # Pad rows that have missing columns
-        max_cols = len(config.SHEET_HEADERS)
-        padded_values = [row + [''] * (max_cols - len(row)) for row in values]
+        # Bottom-up, so each deletion leaves the rows above it where they were
+        for first, last in reversed(group_contiguous(sorted(self.deletes))):
+            requests_body.append({
+                'deleteDimension': {
+                    'range': {
+                        'sheetId': sheet_id,
+                        'dimension': 'ROWS',
+                        'startIndex': first - 1,
+                        'endIndex': last
+                    }
+                }
+            })
+        return requests_body
+    
+    def stale_rows(self):
+        """Return the queued rows that no longer hold the recording they were read with"""
+        if not self.expected:
+            return []
+        current = read_sheet_rows(self.sheets_service, list(self.expected), ROW_IDENTITY_HEADERS)
+        identity = [config.SHEET_HEADERS.index(header) for header in ROW_IDENTITY_HEADERS]
+        return [
+            row_number for row_number, expected in self.expected.items()
+            if [current[row_number][column] for column in identity] != expected
+        ]
+    
+    def flush(self):
+        """Send every pending mutation in one batchUpdate call"""
+        if not self.updates and not self.deletes:
+            return True
+        if not self.sheets_service:
+            return False
         
-        df = pd.DataFrame(padded_values, columns=config.SHEET_HEADERS)
-        # Add row index for reference
-        df['Row'] = range(2, len(df) + 2)  # Starting from row 2 (after header)
-        return df
-    except Exception as e:
-        st.error(f"Error reading sheets: {e}")
-        return pd.DataFrame()
+        try:
+            # The rows came from a snapshot or mirror that may lag behind other editors
+            if self.stale_rows():
+                refresh_recordings(force=True)
+                st.error("The sheet changed since it was loaded, so nothing was modified. Please try again.")
+                return False
+            sheet_id = get_sheet_id(self.sheets_service, config.GOOGLE_SHEETS_ID, get_credentials_key())
+            # Deletes shift rows, so a batch is only re-sent when the API rejected it outright
+            execute_request(self.sheets_service.spreadsheets().batchUpdate(
+                spreadsheetId=config.GOOGLE_SHEETS_ID,
+                body={'requests': self.build_requests(sheet_id)}
+            ), "sheets", idempotent=False)
+            invalidate_sheet_snapshot()
+            mirror = get_active_mirror()
+            if mirror:
+                mirror.apply_mutations(self.updates, self.deletes)
+            self.updates.clear()
+            self.deletes.clear()
+            return True
+        except Exception as e:
+            st.error(f"Error updating sheet: {e}")
+            return False
+
+def update_sheet_row(sheets_service, row_number, data, old_data=None):
+    """Update a specific row in Google Sheets, writing only the changed cells"""
+    batch = SheetMutationBatch(sheets_service)
+    batch.update(row_number, old_data or [None] * len(data), data)
+    return batch.flush()
 
-def update_sheet_row(sheets_service, row_number, data):
-    """Update a specific row in Google Sheets"""
+def delete_sheet_row(sheets_service, row_number, old_data=None):
+    """Delete a specific row in Google Sheets"""
+    batch = SheetMutationBatch(sheets_service)
+    batch.delete(row_number, old_data)
+    return batch.flush()
+
+def add_sheet_row(sheets_service, data):
+    """Add a new row to Google Sheets"""
     if not sheets_service:
         return False
     
     try:
-        range_name = f'{config.SHEET_NAME}!A{row_number}:H{row_number}'
+        range_name = f'{config.SHEET_NAME}!A:H'
         body = {'values': [data]}
         
-        sheets_service.spreadsheets().values().update(
+        execute_request(sheets_service.spreadsheets().values().append(
             spreadsheetId=config.GOOGLE_SHEETS_ID,
             range=range_name,
             valueInputOption='RAW',
+            insertDataOption='INSERT_ROWS',
             body=body
-        ).execute()
+        ), "sheets", idempotent=False)
+        invalidate_sheet_snapshot()
+        mirror = get_active_mirror()
+        if mirror:
+            mirror.request_sync()
         return True
     except Exception as e:
-        st.error(f"Error updating row: {e}")
+        st.error(f"Error adding row: {e}")
         return False
 
-def delete_sheet_row(sheets_service, row_number):
-    """Delete a specific row in Google Sheets"""
-    if not sheets_service:
-        return False
+# =========================
+# SHEET SNAPSHOT
+# =========================
+# Module globals are re-created on every Streamlit rerun, so this dict holds
+# the snapshot handed to the sidebar and the active page during one run only.
+_run_snapshots = {}
+
+def invalidate_sheet_snapshot():
+    """Mark the Recordings snapshot of the active credentials as stale"""
+    invalidate_cache("sheet_snapshot", get_credentials_key())
+
+def refresh_recordings(force=False):
+    """Re-check the sheet now; it is only re-read if its revision changed, unless `force`"""
+    mirror = get_active_mirror()
+    if mirror:
+        mirror.sync(force=force)
+        return
     
+    credentials_key = get_credentials_key()
+    invalidate_cache("sheet_probe", credentials_key)
+    if force or get_sheet_revision(credentials_key) is None:
+        # No revision signal to compare against: fall back to a full re-read
+        invalidate_sheet_snapshot()
+
+@st.cache_data(ttl=config.SHEET_PROBE_INTERVAL, show_spinner=False)
+def probe_sheet_revision(_drive_service, spreadsheet_id, credentials_key, probe_version):
+    """Return the spreadsheet's Drive revision, or None when Drive cannot see it"""
     try:
-        # Get sheet ID (assuming first sheet, ID = 0)
-        sheet_metadata = sheets_service.spreadsheets().get(
-            spreadsheetId=config.GOOGLE_SHEETS_ID
-        ).execute()
-        
-        sheet_id = sheet_metadata['sheets'][0]['properties']['sheetId']
-        
-        request = {
-            'deleteDimension': {
-                'range': {
-                    'sheetId': sheet_id,
-                    'dimension': 'ROWS',
-                    'startIndex': row_number - 1,
-                    'endIndex': row_number
-                }
-            }
+        metadata = get_single_flight().do(
+            ("sheet_revision", credentials_key, spreadsheet_id, probe_version),
+            lambda: execute_request(
+                _drive_service.files().get(fileId=spreadsheet_id, fields='version,modifiedTime'), "drive"
+            )
+        )
+    except Exception:
+        return None
+    return metadata.get('version') or metadata.get('modifiedTime')
+
+def get_sheet_revision(credentials_key):
+    """Probe the sheet's revision once per run (None if unavailable)"""
+    run_key = ("revision", credentials_key)
+    if run_key not in _run_snapshots:
+        sheets_service, drive_service = get_google_services()
+        _run_snapshots[run_key] = probe_sheet_revision(
+            drive_service, config.GOOGLE_SHEETS_ID, credentials_key, cache_version("sheet_probe", credentials_key)
+        ) if drive_service else None
+    return _run_snapshots[run_key]
+
+@st.cache_data(max_entries=config.SNAPSHOT_CACHE_ENTRIES, show_spinner=False)
+def fetch_sheet_snapshot(_sheets_service, spreadsheet_id, credentials_key, version, revision):
+    """Fetch the A2:H range once per (spreadsheet, credentials, version, revision)"""
+    return get_single_flight().do(
+        ("sheet_values", credentials_key, spreadsheet_id, "A2:H", version, revision),
+        lambda: read_sheets_data(_sheets_service)
+    )
+
+@st.cache_data(ttl=config.CACHE_TTL, show_spinner=False)
+def fetch_sheet_window(_sheets_service, spreadsheet_id, credentials_key, version, start_row, row_count, headers):
+    """Fetch one row window of selected columns as a typed frame, once per snapshot version"""
+    values = get_single_flight().do(
+        ("sheet_window", credentials_key, spreadsheet_id, version, start_row, row_count, headers),
+        lambda: read_sheet_window(_sheets_service, start_row, row_count, headers)
+    )
+    return build_recordings_frame(values, range(start_row, start_row + len(values)))
+
+@st.cache_data(max_entries=config.SNAPSHOT_CACHE_ENTRIES, show_spinner=False)
+def fetch_mirror_snapshot(_mirror, credentials_key, instance, version):
+    """Read the local mirror once per mirror instance and version"""
+    return _mirror.frame()
+
+def get_snapshot_key():
+    """Identify the current Recordings snapshot by credentials and version"""
+    credentials_key = get_credentials_key()
+    mirror = get_active_mirror()
+    if mirror:
+        return (credentials_key, "mirror", mirror.instance, mirror.version)
+    
+    revision = get_sheet_revision(credentials_key)
+    if revision is None:
+        # Without a revision signal, expire the snapshot every CACHE_TTL seconds instead
+        revision = f"ttl:{int(time.time() // config.CACHE_TTL)}"
+    return (credentials_key, cache_version("sheet_snapshot", credentials_key), revision)
+
+def get_recordings_snapshot(sheets_service, headers=None):
+    """Return the Recordings DataFrame shared by the sidebar and every page, optionally limited to `headers`"""
+    if not sheets_service:
+        return pd.DataFrame()
+    
+    credentials_key = get_credentials_key()
+    mirror = get_active_mirror()
+    snapshot_key = get_snapshot_key()
+    
+    if mirror and mirror.last_sync is None and mirror.last_error:
+        st.error(f"Error reading sheets: {mirror.last_error}")
+    
+    run_key = snapshot_key if mirror or not headers or snapshot_key in _run_snapshots else (*snapshot_key, tuple(headers))
+    
+    if run_key not in _run_snapshots:
+        try:
+            if mirror:
+                _run_snapshots[run_key] = fetch_mirror_snapshot(mirror, credentials_key, mirror.instance, mirror.version)
+            elif headers:
+                version = snapshot_key[1:]
+                row_count = get_sheet_row_count(sheets_service, config.GOOGLE_SHEETS_ID, credentials_key, version)
+                _run_snapshots[run_key] = fetch_sheet_window(
+                    sheets_service, config.GOOGLE_SHEETS_ID, credentials_key, version, 2, row_count, tuple(headers)
+                )
+            else:
+                _run_snapshots[run_key] = fetch_sheet_snapshot(
+                    sheets_service, config.GOOGLE_SHEETS_ID, *snapshot_key
+                )
+        except Exception as e:
+            st.error(f"Error reading sheets: {e}")
+            return pd.DataFrame()
+    
+    return _run_snapshots[run_key]
+
+def query_recordings(df, categories=None, search="", sort_by=None):
+    """Filter, search and sort recordings, in SQLite when the mirror is active"""
+    mirror = get_active_mirror()
+    if mirror:
+        return mirror.query(categories, search, sort_by)
+    
+    filtered_df = df.copy()
+    
+    if categories:
+        filtered_df = filtered_df[filtered_df['Category'].isin(categories)]
+    
+    if search:
+        filtered_df = filtered_df[
+            filtered_df['Title'].str.contains(search, case=False, na=False, regex=False)
+        ]
+    
+    if sort_by == "Newest First":
+        filtered_df = filtered_df.sort_values('Recorded At', ascending=False)
+    elif sort_by == "Oldest First":
+        filtered_df = filtered_df.sort_values('Recorded At', ascending=True)
+    elif sort_by == "Title A-Z":
+        filtered_df = filtered_df.sort_values('Title', ascending=True)
+    elif sort_by == "Title Z-A":
+        filtered_df = filtered_df.sort_values('Title', ascending=False)
+    elif sort_by == "Most Words":
+        filtered_df = filtered_df.sort_values('Word Count', ascending=False)
+    
+    return filtered_df
+
+# =========================
+# RECORDING METRICS
+# =========================
+# Every column the metrics and the sidebar's latest recording read; a snapshot
+# projected to these yields the same metrics
+METRIC_HEADERS = ('Timestamp', 'Title', 'Category', 'Duration', 'Words')
+
+@st.cache_data(max_entries=config.SNAPSHOT_CACHE_ENTRIES, show_spinner=False)
+def compute_recording_metrics(_df, snapshot_key, today):
+    """Compute every dashboard aggregate in one pass, once per snapshot and day"""
+    if _df.empty:
+        return {
+            "total": 0, "total_words": 0, "avg_words": 0,
+            "today": 0, "this_week": 0, "unique_categories": 0,
+            "most_common_category": None,
+            "category_counts": pd.Series(dtype="int64"),
+            "category_stats": pd.DataFrame(columns=['Count', 'Total Words', 'Avg Words']),
         }
+    
+    today = pd.Timestamp(today)
+    days = _df['Recorded At'].dt.normalize()
+    words = _df['Word Count']
+    
+    category_stats = (
+        _df.groupby('Category', observed=True)['Word Count']
+        .agg(['count', 'sum', 'mean'])
+        .round(0)
+    )
+    category_stats.columns = ['Count', 'Total Words', 'Avg Words']
+    category_counts = category_stats['Count'].sort_values(ascending=False).rename('count')
+    
+    return {
+        "total": len(_df),
+        "total_words": int(words.sum()),
+        "avg_words": int(words.mean()),
+        "today": int((days == today).sum()),
+        "this_week": int((_df['Recorded At'] >= today - pd.Timedelta(days=7)).sum()),
+        "unique_categories": len(category_stats),
+        "most_common_category": category_counts.index[0] if len(category_counts) else None,
+        "category_counts": category_counts,
+        "category_stats": category_stats,
+    }
+
+def get_recording_metrics(df):
+    """Return the memoized metrics of the current snapshot"""
+    return compute_recording_metrics(df, get_snapshot_key(), pd.Timestamp.now().normalize().isoformat())
+
+ROLLUP_GRAINS = {"Daily": "day", "Weekly": "week", "Monthly": "month"}
+
+def rollup_periods(timestamps):
+    """Map each timestamp to the 'YYYY-MM-DD' start of its day, week (Monday) and month"""
+    day = timestamps.dt.normalize()
+    periods = {
+        "day": day,
+        "week": day - pd.to_timedelta(day.dt.weekday, unit='D'),
+        "month": day - pd.to_timedelta(day.dt.day - 1, unit='D'),
+    }
+    return {grain: period.dt.strftime('%Y-%m-%d') for grain, period in periods.items()}
+
+def timeline_frame(rows):
+    """Build the timeline DataFrame from (period, count, words, duration seconds) rows"""
+    timeline = pd.DataFrame(rows, columns=['Date', 'Count', 'Words', 'Duration Seconds'])
+    timeline['Date'] = pd.to_datetime(timeline['Date'])
+    timeline['Duration (min)'] = (timeline.pop('Duration Seconds') / 60).round(1)
+    return timeline.set_index('Date')
+
+@st.cache_data(max_entries=config.SNAPSHOT_CACHE_ENTRIES, show_spinner=False)
+def compute_recording_timeline(_df, snapshot_key, grain):
+    """Aggregate the snapshot per day, week or month when there is no mirror"""
+    grouped = _df.groupby(rollup_periods(_df['Recorded At'])[grain]).agg(
+        count=('Word Count', 'size'), words=('Word Count', 'sum'), duration=('Duration Seconds', 'sum')
+    )
+    return timeline_frame(list(grouped.itertuples(name=None)))
+
+def get_recording_rollups(df, grain):
+    """Return (timeline, category stats), from the mirror's rollup tables when active"""
+    mirror = get_active_mirror()
+    if mirror:
+        return mirror.timeline(grain), mirror.category_rollup()
+    return (
+        compute_recording_timeline(df, get_snapshot_key(), grain),
+        get_recording_metrics(df)["category_stats"],
+    )
+
+# =========================
+# LOCAL SHEET MIRROR
+# =========================
+MIRROR_COLUMNS = list(config.SHEET_COLUMNS)  # timestamp, title, ... in sheet column order
+# Bumped whenever rollup periods are computed differently, to rebuild stored rollups
+ROLLUP_SCHEMA = '2'
+
+MIRROR_SORTS = {
+    "Newest First": "timestamp DESC",
+    "Oldest First": "timestamp ASC",
+    "Title A-Z": "title ASC",
+    "Title Z-A": "title DESC",
+    "Most Words": "CAST(REPLACE(words, ',', '') AS INTEGER) DESC",
+}
+
+class SheetMirror:
+    """Local SQLite copy of the Recordings tab, with incrementally maintained rollups, kept fresh by a background thread"""
+    
+    def __init__(self, db_path, build_sheets_service, build_drive_service=None):
+        self.flight = SingleFlight()
+        self.build_sheets_service = build_sheets_service
+        self.build_drive_service = build_drive_service
+        self.sheets_service = None
+        self.drive_service = None
+        self.lock = threading.Lock()
+        self.sync_lock = threading.Lock()
+        self.wake_event = threading.Event()
+        self.stop_event = threading.Event()
+        # `version` restarts at 0 for every instance, so cache keys carry both
+        self.instance = uuid.uuid4().hex
+        self.version = 0
+        self.last_error = None
         
-        body = {'requests': [request]}
-        sheets_service.spreadsheets().batchUpdate(
-            spreadsheetId=config.GOOGLE_SHEETS_ID,
-            body=body
-        ).execute()
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        columns = ", ".join(f"{column} TEXT NOT NULL DEFAULT ''" for column in MIRROR_COLUMNS)
+        with self.conn:
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS recordings (row INTEGER PRIMARY KEY, {columns})")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS rollup_timeline (grain TEXT, period TEXT, count INTEGER, "
+                "words INTEGER, duration INTEGER, PRIMARY KEY (grain, period))"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS rollup_category (category TEXT PRIMARY KEY, count INTEGER, "
+                "words INTEGER, duration INTEGER)"
+            )
+            rollups = self.conn.execute("SELECT value FROM meta WHERE key = 'rollups'").fetchone()
+            if not rollups or rollups[0] != ROLLUP_SCHEMA:
+                # Mirror files from before the rollup tables existed, or from before
+                # the current timestamp parsing: rebuild once
+                self.conn.execute("DELETE FROM rollup_timeline")
+                self.conn.execute("DELETE FROM rollup_category")
+                self._apply_rollup_delta([], self._cells())
+                self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('rollups', ?)", (ROLLUP_SCHEMA,))
+        last_sync = self.conn.execute("SELECT value FROM meta WHERE key = 'last_sync'").fetchone()
+        self.last_sync = float(last_sync[0]) if last_sync else None
+        revision = self.conn.execute("SELECT value FROM meta WHERE key = 'revision'").fetchone()
+        self.revision = revision[0] if revision else None
+    
+    def start(self):
+        """Start the background sync thread"""
+        threading.Thread(target=self._run, name="sheet-mirror", daemon=True).start()
+    
+    def stop(self):
+        self.stop_event.set()
+        self.wake_event.set()
+    
+    def request_sync(self):
+        """Ask the background thread to sync now instead of waiting for the interval"""
+        self.wake_event.set()
+    
+    def _run(self):
+        while not self.stop_event.is_set():
+            try:
+                self.sync(lane="bulk")
+            except Exception as e:
+                # Keep the thread alive; the sidebar shows the error until a sync succeeds
+                self.last_error = str(e)
+            self.wake_event.wait(config.MIRROR_SYNC_INTERVAL)
+            self.wake_event.clear()
+    
+    def probe_revision(self, lane="interactive"):
+        """Return the spreadsheet's Drive revision, or None when it cannot be read"""
+        if self.build_drive_service is None:
+            return None
+        try:
+            if self.drive_service is None:
+                self.drive_service = self.build_drive_service()
+            metadata = execute_request(self.drive_service.files().get(
+                fileId=config.GOOGLE_SHEETS_ID, fields='version,modifiedTime'
+            ), "drive", lane)
+        except Exception:
+            return None
+        return metadata.get('version') or metadata.get('modifiedTime')
+    
+    def sync(self, lane="interactive", force=False):
+        """Pull the sheet if its Drive revision changed (or `force`) and apply the changed rows; True on success"""
+        # A sync requested while another is running joins it instead of starting a second read
+        return self.flight.do(("sync", force), lambda: self._sync(lane, force))
+    
+    def _sync(self, lane, force=False):
+        with self.sync_lock:
+            revision = self.probe_revision(lane)
+            if not force and revision is not None and revision == self.revision:
+                with self.lock, self.conn:
+                    self._mark_synced()
+                self.last_error = None
+                return True
+            
+            try:
+                if self.sheets_service is None:
+                    self.sheets_service = self.build_sheets_service()
+                values = read_sheet_values(self.sheets_service, lane)
+            except Exception as e:
+                self.last_error = str(e)
+                return False
+            
+            try:
+                self._apply_values(values, revision)
+            except Exception as e:
+                self.last_error = str(e)
+                return False
+            self.last_error = None
+            return True
+    
+    def _mark_synced(self):
+        self.last_sync = time.time()
+        self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('last_sync', ?)", (str(self.last_sync),))
+    
+    def _cells(self, rows=None):
+        """Return {row: cells} for the given rows, or for every row"""
+        query = f"SELECT row, {', '.join(MIRROR_COLUMNS)} FROM recordings"
+        if rows is None:
+            result = self.conn.execute(query)
+        else:
+            rows = list(rows)
+            result = self.conn.execute(f"{query} WHERE row IN ({', '.join('?' * len(rows))})", rows)
+        return {row[0]: list(row[1:]) for row in result}
+    
+    def _apply_rollup_delta(self, removed_cells, added_cells):
+        """Subtract removed rows from and add added rows to the rollup tables"""
+        if isinstance(removed_cells, dict):
+            removed_cells = list(removed_cells.values())
+        if isinstance(added_cells, dict):
+            added_cells = list(added_cells.values())
+        if not removed_cells and not added_cells:
+            return
+        
+        df = build_recordings_frame(removed_cells + added_cells)
+        sign = pd.Series([-1] * len(removed_cells) + [1] * len(added_cells), index=df.index)
+        delta = pd.DataFrame({
+            'count': sign,
+            'words': df['Word Count'].astype('int64') * sign,
+            'duration': df['Duration Seconds'].astype('int64') * sign,
+        })
+        
+        timeline_rows = []
+        for grain, period in rollup_periods(df['Recorded At']).items():
+            grouped = delta.groupby(period).sum()
+            timeline_rows.extend((grain, *values) for values in grouped.itertuples(name=None))
+        category_rows = list(delta.groupby(df['Category'].astype(str)).sum().itertuples(name=None))
+        
+        upsert = "count = count + excluded.count, words = words + excluded.words, duration = duration + excluded.duration"
+        self.conn.executemany(
+            f"INSERT INTO rollup_timeline VALUES (?, ?, ?, ?, ?) ON CONFLICT (grain, period) DO UPDATE SET {upsert}",
+            timeline_rows
+        )
+        self.conn.executemany(
+            f"INSERT INTO rollup_category VALUES (?, ?, ?, ?) ON CONFLICT (category) DO UPDATE SET {upsert}",
+            category_rows
+        )
+        self.conn.execute("DELETE FROM rollup_timeline WHERE count <= 0")
+        self.conn.execute("DELETE FROM rollup_category WHERE count <= 0")
+    
+    def _apply_values(self, values, revision=None):
+        placeholders = ", ".join("?" * (len(MIRROR_COLUMNS) + 1))
+        with self.lock, self.conn:
+            existing = self._cells()
+            changed = [
+                (row_number, *cells)
+                for row_number, cells in enumerate(values, start=2)
+                if existing.get(row_number) != list(cells)
+            ]
+            removed = [(row_number,) for row_number in existing if row_number >= len(values) + 2]
+            
+            self._apply_rollup_delta(
+                [existing[row[0]] for row in changed + removed if row[0] in existing],
+                [list(row[1:]) for row in changed]
+            )
+            self.conn.executemany(f"INSERT OR REPLACE INTO recordings VALUES ({placeholders})", changed)
+            self.conn.executemany("DELETE FROM recordings WHERE row = ?", removed)
+            self._mark_synced()
+            self.revision = revision
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('revision', ?)", (revision,))
+            if changed or removed:
+                self.version += 1
+    
+    def apply_mutations(self, updates, deletes):
+        """Mirror a flushed SheetMutationBatch (row numbers from before the flush)"""
+        with self.lock, self.conn:
+            before = self._cells(set(updates) | set(deletes))
+            for row_number, cells in updates.items():
+                assignments = ", ".join(f"{MIRROR_COLUMNS[column]} = ?" for column in cells)
+                self.conn.execute(
+                    f"UPDATE recordings SET {assignments} WHERE row = ?",
+                    [str(value) for value in cells.values()] + [row_number]
+                )
+            self._apply_rollup_delta(before, self._cells(set(updates) - set(deletes)))
+            for row_number in sorted(deletes, reverse=True):
+                self.conn.execute("DELETE FROM recordings WHERE row = ?", (row_number,))
+                # Shift rows up in two steps so the primary key never collides
+                self.conn.execute("UPDATE recordings SET row = -(row - 1) WHERE row > ?", (row_number,))
+                self.conn.execute("UPDATE recordings SET row = -row WHERE row < 0")
+            self.version += 1
+    
+    def _select(self, where="", params=(), order="row"):
+        columns = ", ".join(MIRROR_COLUMNS)
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT row, {columns} FROM recordings {where} ORDER BY {order}", params
+            ).fetchall()
+        return build_recordings_frame([list(row[1:]) for row in rows], [row[0] for row in rows])
+    
+    def frame(self):
+        """Return every mirrored recording in sheet order"""
+        return self._select()
+    
+    def query(self, categories=None, search="", sort_by=None):
+        """Filter by category, search titles and sort inside SQLite"""
+        clauses, params = [], []
+        if categories:
+            clauses.append(f"category IN ({', '.join('?' * len(categories))})")
+            params.extend(categories)
+        if search:
+            escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            clauses.append("title LIKE ? ESCAPE '\\'")
+            params.append(f"%{escaped}%")
+        
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._select(where, params, MIRROR_SORTS.get(sort_by, "row"))
+    
+    def timeline(self, grain):
+        """Return the count/words/duration timeline for 'day', 'week' or 'month'"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT period, count, words, duration FROM rollup_timeline WHERE grain = ? ORDER BY period",
+                (grain,)
+            ).fetchall()
+        return timeline_frame(rows)
+    
+    def category_rollup(self):
+        """Return per-category Count, Total Words and Avg Words"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT category, count, words FROM rollup_category ORDER BY category"
+            ).fetchall()
+        stats = pd.DataFrame(rows, columns=['Category', 'Count', 'Total Words']).set_index('Category')
+        stats['Avg Words'] = (stats['Total Words'] / stats['Count']).round(0)
+        return stats
+    
+    def status(self):
+        """Return (seconds since the last successful sync or None, last error)"""
+        age = time.time() - self.last_sync if self.last_sync else None
+        return age, self.last_error
+
+@st.cache_resource
+def get_sheet_mirror(credentials_key, version, _clients):
+    """Open the mirror for one credentials identity and start its sync thread"""
+    digest = hashlib.sha256(credentials_key.encode()).hexdigest()[:16]
+    mirror = SheetMirror(
+        os.path.join(config.MIRROR_DIR, f"recordings-{digest}.sqlite3"),
+        lambda: _clients.sheets_service,
+        lambda: _clients.drive_service
+    )
+    if mirror.last_sync is None:
+        # First start: fill the mirror before the first page renders
+        mirror.sync()
+    mirror.start()
+    return mirror
+
+def get_active_mirror():
+    """Return the mirror for the active credentials, or None when disabled or not connected"""
+    if not config.ENABLE_SHEET_MIRROR:
+        return None
+    
+    clients = get_google_clients()
+    if clients is None:
+        return None
+    
+    credentials_key = get_credentials_key()
+    return get_sheet_mirror(credentials_key, cache_version("google_services", credentials_key), clients)
+
+# =========================
+# TRANSCRIPT SEARCH
+# =========================
+# Private-use characters mark snippet matches so they survive HTML escaping
+SNIPPET_MATCH_START, SNIPPET_MATCH_END = "\ue000", "\ue001"
+
+def build_fts_query(text):
+    """Turn search box input into an FTS5 query that can never be a syntax error"""
+    terms = []
+    for phrase, word in re.findall(r'"([^"]*)"?|(\S+)', text):
+        tokens = re.findall(r'\w+', phrase or word)
+        if not tokens:
+            continue
+        if phrase:
+            terms.append('"' + " ".join(tokens) + '"')
+        else:
+            terms.extend(f'"{token}"' for token in tokens)
+            if word.endswith("*"):
+                terms[-1] += "*"
+    return " ".join(terms)
+
+def highlight_snippet(snippet):
+    """Escape a search snippet and turn its match markers into <mark> tags"""
+    return (
+        html.escape(snippet)
+        .replace(SNIPPET_MATCH_START, "<mark>")
+        .replace(SNIPPET_MATCH_END, "</mark>")
+    )
+
+class TranscriptIndex:
+    """Persistent SQLite FTS5 index over transcript text, keyed by Doc ID (or audio file ID)"""
+    
+    def __init__(self, db_path):
+        self.lock = threading.Lock()
+        self.backfill_lock = threading.Lock()
+        self.failed = set()  # Doc IDs that could not be exported this process
+        
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS documents (id INTEGER PRIMARY KEY, doc_id TEXT UNIQUE, "
+                "audio_id TEXT, title TEXT, indexed_at REAL)"
+            )
+            self.conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS transcripts USING fts5("
+                "title, body, tokenize = 'unicode61 remove_diacritics 2')"
+            )
+    
+    def add(self, doc_id, audio_id, title, body):
+        """Index (or re-index) one transcript"""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO documents (doc_id, audio_id, title, indexed_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (doc_id) DO UPDATE SET audio_id = excluded.audio_id, "
+                "title = excluded.title, indexed_at = excluded.indexed_at",
+                (doc_id, audio_id, title, time.time())
+            )
+            rowid = self.conn.execute("SELECT id FROM documents WHERE doc_id = ?", (doc_id,)).fetchone()[0]
+            self.conn.execute("DELETE FROM transcripts WHERE rowid = ?", (rowid,))
+            self.conn.execute("INSERT INTO transcripts (rowid, title, body) VALUES (?, ?, ?)", (rowid, title, body))
+    
+    def add_job_result(self, job):
+        """Index the transcription of a finished TranscriptionJobQueue job"""
+        result = job.get("result") or {}
+        text = result.get("transcription")
+        if not text:
+            return
+        audio_id = extract_drive_file_id(result.get("drive_link", ""))
+        doc_id = extract_drive_file_id(result.get("doc_link", "")) or audio_id or f"job:{job['id']}"
+        self.add(doc_id, audio_id, job["metadata"]["title"], text)
+    
+    def known_ids(self):
+        """Doc IDs already indexed or already failed to export"""
+        with self.lock:
+            indexed = {row[0] for row in self.conn.execute("SELECT doc_id FROM documents")}
+        return indexed | self.failed
+    
+    def search(self, query, limit=config.TRANSCRIPT_SEARCH_LIMIT):
+        """Return [{doc_id, audio_id, snippet, rank}] best match first"""
+        fts_query = build_fts_query(query)
+        if not fts_query:
+            return []
+        
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT d.doc_id, d.audio_id, snippet(transcripts, 1, ?, ?, ' … ', ?), "
+                "bm25(transcripts, 5.0, 1.0) AS rank "
+                "FROM transcripts JOIN documents d ON d.id = transcripts.rowid "
+                "WHERE transcripts MATCH ? ORDER BY rank LIMIT ?",
+                (SNIPPET_MATCH_START, SNIPPET_MATCH_END, config.TRANSCRIPT_SNIPPET_TOKENS, fts_query, limit)
+            ).fetchall()
+        return [
+            {"doc_id": doc_id, "audio_id": audio_id, "snippet": snippet, "rank": rank}
+            for doc_id, audio_id, snippet, rank in rows
+        ]
+    
+    def start_backfill(self, pending, build_drive_service):
+        """Export and index [(doc_id, audio_id, title)] on a background thread; False if one is already running"""
+        if not pending or not self.backfill_lock.acquire(blocking=False):
+            return False
+        
+        def run():
+            try:
+                drive_service = build_drive_service()
+                for doc_id, audio_id, title in pending:
+                    try:
+                        body = execute_request(
+                            drive_service.files().export(fileId=doc_id, mimeType='text/plain'), "drive", "bulk"
+                        )
+                    except HttpError as e:
+                        if is_retryable_api_error(e):
+                            # Still throttled after every retry: leave the rest for the next pass
+                            break
+                        self.failed.add(doc_id)
+                        continue
+                    except Exception:
+                        self.failed.add(doc_id)
+                        continue
+                    self.add(doc_id, audio_id, title, body.decode('utf-8', errors='replace'))
+            finally:
+                self.backfill_lock.release()
+        
+        threading.Thread(target=run, name="transcript-backfill", daemon=True).start()
         return True
-    except Exception as e:
-        st.error(f"Error deleting row: {e}")
-        return False
 
-def add_sheet_row(sheets_service, data):
-    """Add a new row to Google Sheets"""
-    if not sheets_service:
-        return False
+@st.cache_resource
+def get_transcript_index():
+    """Process-wide transcript index shared by every session and the job queue"""
+    return TranscriptIndex(config.TRANSCRIPT_INDEX_PATH)
+
+def backfill_transcript_index(df):
+    """Queue transcripts linked from the sheet that are not indexed yet; returns how many"""
+    index = get_transcript_index()
+    known = index.known_ids()
+    pending = [
+        (doc_id, audio_id if isinstance(audio_id, str) else None, title)
+        for doc_id, audio_id, title in zip(extract_drive_file_ids(df['Sheet Link']), df['File ID'], df['Title'])
+        if isinstance(doc_id, str) and doc_id not in known
+    ]
+    if pending:
+        clients = get_google_clients()
+        if clients:
+            index.start_backfill(pending, lambda: clients.drive_service)
+    return len(pending)
+
+def search_transcripts(df, query):
+    """Return the recordings whose transcript matches, best first, with a 'Snippet' column"""
+    hits = get_transcript_index().search(query)
+    if not hits:
+        return df.iloc[0:0].assign(Snippet=pd.Series(dtype=object))
+    
+    doc_ids = extract_drive_file_ids(df['Sheet Link'])
+    order, snippets = pd.Series(float('inf'), index=df.index), pd.Series('', index=df.index)
+    for position, hit in reversed(list(enumerate(hits))):
+        matched = (doc_ids == hit["doc_id"])
+        if hit["audio_id"]:
+            matched |= (df['File ID'] == hit["audio_id"])
+        order[matched] = position
+        snippets[matched] = hit["snippet"]
+    
+    found = order < float('inf')
+    return df[found].assign(Snippet=snippets[found]).loc[order[found].sort_values(kind='stable').index]
+
+# =========================
+# CONCURRENT PREFETCH
+# =========================
+# Pages that render from the full snapshot; the others read projected windows
+FULL_SNAPSHOT_PAGES = ("Dashboard", "Library", "Analytics")
+
+class FetchPool:
+    """Bounded worker pool running independent Google API reads concurrently, with the script's run context attached"""
+    
+    def __init__(self, workers):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fetch")
+    
+    def run(self, tasks, clients):
+        """Run {name: fn(sheets_service, drive_service)} and return {name: result or the exception it raised}"""
+        ctx = get_script_run_ctx()
+        
+        def call(fn):
+            add_script_run_ctx(threading.current_thread(), ctx)
+            return fn(clients.sheets_service, clients.drive_service)
+        
+        futures = {name: self.executor.submit(call, fn) for name, fn in tasks.items()}
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                results[name] = e
+        return results
+
+@st.cache_resource
+def get_fetch_pool():
+    """Process-wide prefetch pool shared by every session"""
+    return FetchPool(config.FETCH_WORKERS)
+
+def remember_visible_files(page_df):
+    """Note the Drive files on screen, batch-load their missing metadata and drop off-screen Load & Play flags"""
+    visible_keys = set(page_df['Key'])
+    st.session_state.loaded_audio = {
+        key for key in st.session_state.loaded_audio if key.partition('_')[2] in visible_keys
+    }
     
-    try:
-        range_name = f'{config.SHEET_NAME}!A:H'
-        body = {'values': [data]}
-        
-        sheets_service.spreadsheets().values().append(
-            spreadsheetId=config.GOOGLE_SHEETS_ID,
-            range=range_name,
-            valueInputOption='RAW',
-            insertDataOption='INSERT_ROWS',
-            body=body
-        ).execute()
-        return True
-    except Exception as e:
-        st.error(f"Error adding row: {e}")
-        return False
+    file_ids = page_df['File ID'].dropna().tolist()
+    st.session_state.visible_file_ids = file_ids
+    get_drive_metadata(get_google_services()[1], file_ids)
+
+def prefetch_page_data():
+    """Warm the snapshot, sheet metadata and visible files' Drive metadata in parallel"""
+    clients = get_google_clients()
+    if clients is None:
+        return
+    
+    credentials_key = get_credentials_key()
+    snapshot_key = get_snapshot_key()
+    
+    tasks = {
+        "sheet_id": lambda sheets, drive: get_sheet_id(sheets, config.GOOGLE_SHEETS_ID, credentials_key),
+    }
+    
+    if not get_active_mirror() and snapshot_key not in _run_snapshots:
+        # The navigation radio's new value is already in session state before the sidebar renders
+        page = PAGE_MAP.get(st.session_state.get("nav_page"), st.session_state.get("page"))
+        if page in FULL_SNAPSHOT_PAGES:
+            def read_snapshot(sheets, drive):
+                _run_snapshots[snapshot_key] = fetch_sheet_snapshot(sheets, config.GOOGLE_SHEETS_ID, *snapshot_key)
+            tasks["snapshot"] = read_snapshot
+        else:
+            tasks["row_count"] = lambda sheets, drive: get_sheet_row_count(
+                sheets, config.GOOGLE_SHEETS_ID, credentials_key, snapshot_key[1:]
+            )
+    
+    metadata_cache = get_drive_metadata_cache()
+    visible = [
+        file_id for file_id in st.session_state.get("visible_file_ids", [])
+        if metadata_cache.get(credentials_key, file_id) is None
+    ]
+    if visible:
+        tasks["drive_metadata"] = lambda sheets, drive: metadata_cache.fetch(drive, credentials_key, visible)
+    
+    get_fetch_pool().run(tasks, clients)
 
 # =========================
 # SESSION STATE INITIALIZATION
@@ -515,10 +2240,12 @@ def init_session_state():
         "page": "Dashboard",
         "response_data": None,
         "edit_mode": False,
-        "edit_row": None,
+        "edit_key": None,
         "view_mode": "cards",
         "playing_audio": None,
         "selected_recording": None,
+        "loaded_audio": set(),
+        "job_id": None,
     }
     
     for key, value in defaults.items():
@@ -530,6 +2257,14 @@ init_session_state()
 # =========================
 # SIDEBAR - NAVIGATION & STATS
 # =========================
+PAGE_MAP = {
+    "📊 Dashboard": "Dashboard",
+    "🎙️ Record": "Record",
+    "📚 Library": "Library",
+    "🎵 Player": "Player",
+    "📈 Analytics": "Analytics"
+}
+
 def render_sidebar():
     """Render sidebar with navigation and statistics"""
     with st.sidebar:
@@ -543,18 +2278,12 @@ def render_sidebar():
         # Page Navigation
         page = st.radio(
             "📍 Navigation",
-            ["📊 Dashboard", "🎙️ Record", "📚 Library", "🎵 Player", "📈 Analytics"],
-            label_visibility="visible"
+            list(PAGE_MAP),
+            label_visibility="visible",
+            key="nav_page"
         )
         
-        page_map = {
-            "📊 Dashboard": "Dashboard",
-            "🎙️ Record": "Record",
-            "📚 Library": "Library",
-            "🎵 Player": "Player",
-            "📈 Analytics": "Analytics"
-        }
-        st.session_state.page = page_map[page]
+        st.session_state.page = PAGE_MAP[page]
         
         st.divider()
         
@@ -578,10 +2307,15 @@ def render_google_auth_section():
         
         # Logout button
         if st.button("🚪 Disconnect", use_container_width=True):
+            credentials_key = get_credentials_key()
+            mirror = get_active_mirror()
+            if mirror:
+                mirror.stop()
+            invalidate_cache("google_services", credentials_key)
+            invalidate_cache("sheet_snapshot", credentials_key)
+            get_client_registry().discard(credentials_key)
             if 'google_credentials' in st.session_state:
                 del st.session_state.google_credentials
-            st.cache_resource.clear()
-            st.cache_data.clear()
             st.rerun()
     else:
         st.warning("⚠️ Not connected")
@@ -602,7 +2336,6 @@ def render_google_auth_section():
                     if all(field in credentials_dict for field in required_fields):
                         st.session_state.google_credentials = credentials_dict
                         st.success("✅ Loaded!")
-                        st.cache_resource.clear()
                         st.rerun()
                     else:
                         st.error("❌ Invalid file")
@@ -618,30 +2351,35 @@ def render_quick_stats():
         return
     
     with st.spinner("Loading..."):
-        df = read_sheets_data(sheets_service)
+        df = get_recordings_snapshot(sheets_service, METRIC_HEADERS)
+    
+    metrics = get_recording_metrics(df)
     
     st.subheader("⚡ Quick Stats")
     
     # Total recordings
-    st.metric("📼 Recordings", len(df))
-    
-    # Total words
-    if not df.empty and 'Words' in df.columns:
-        try:
-            total_words = df['Words'].astype(str).str.replace(',', '').replace('', '0')
-            total_words = pd.to_numeric(total_words, errors='coerce').fillna(0).sum()
-            st.metric("📝 Total Words", f"{int(total_words):,}")
-        except:
-            st.metric("📝 Total Words", "N/A")
+    st.metric("📼 Recordings", metrics["total"])
     
-    # Today's recordings
-    if not df.empty and 'Timestamp' in df.columns:
-        try:
-            today = datetime.now().strftime('%Y-%m-%d')
-            today_count = df['Timestamp'].str.contains(today, na=False).sum()
-            st.metric("🎯 Today", today_count)
-        except:
-            pass
+    if not df.empty:
+        st.metric("📝 Total Words", f"{metrics['total_words']:,}")
+        st.metric("🎯 Today", metrics["today"])
+    
+    # Mirror freshness
+    mirror = get_active_mirror()
+    if mirror:
+        age, error = mirror.status()
+        if error:
+            st.caption(f"⚠️ Sync error: {error[:80]}")
+        if age is not None:
+            st.caption(f"🔄 Synced {int(age)}s ago")
+    
+    # Audio cache counters
+    cache_stats = get_audio_cache().stats()
+    st.caption(
+        f"💾 Audio cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses · "
+        f"{cache_stats['bytes_used'] / (1024 * 1024):.0f} MB used · "
+        f"{cache_stats['bytes_evicted'] / (1024 * 1024):.0f} MB evicted"
+    )
     
     # Latest recording
     if not df.empty:
@@ -651,6 +2389,68 @@ def render_quick_stats():
         st.caption(f"**{latest.get('Title', 'Untitled')[:25]}...**")
         st.caption(f"📂 {latest.get('Category', 'N/A')}")
 
+# =========================
+# WINDOWED LISTS
+# =========================
+def paginate(df, key, view=None, page_size=config.RECORDINGS_PER_PAGE):
+    """Return the visible window of df and render its Prev/Next controls, keeping the cursor on a recording Key"""
+    total = len(df)
+    if total <= page_size:
+        remember_visible_files(df)
+        return df
+    
+    cursor_key = f"{key}_cursor"
+    keys = df['Key'].to_numpy()
+    last_start = (total - 1) // page_size * page_size
+    
+    start = 0
+    cursor = st.session_state.get(cursor_key)
+    if cursor and cursor["view"] == view:
+        positions = (keys == cursor.get("key")).nonzero()[0]
+        start = int(positions[0]) if len(positions) else min(cursor["offset"], last_start)
+    
+    def move_to(new_start):
+        new_start = max(0, min(new_start, last_start))
+        st.session_state[cursor_key] = {"key": keys[new_start], "offset": new_start, "view": view}
+    
+    render_pager(key, start, total, page_size, move_to)
+    page_df = df.iloc[start:start + page_size]
+    remember_visible_files(page_df)
+    return page_df
+
+def paginate_sheet(total, key, page_size=config.RECORDINGS_PER_PAGE):
+    """Render paging controls over `total` sheet rows and return the first row number to read"""
+    last_start = max(total - 1, 0) // page_size * page_size
+    cursor_key = f"{key}_cursor"
+    cursor = st.session_state.get(cursor_key)
+    start = min(cursor["offset"], last_start) if cursor and cursor["view"] == "sheet" else 0
+    
+    def move_to(new_start):
+        new_start = max(0, min(new_start, last_start))
+        st.session_state[cursor_key] = {"row": new_start + 2, "offset": new_start, "view": "sheet"}
+    
+    if total > page_size:
+        render_pager(key, start, total, page_size, move_to)
+    return start + 2  # data starts below the header row
+
+def render_pager(key, start, total, page_size, move_to):
+    """Render Prev / position / Next controls for a window starting at `start`"""
+    last_start = (total - 1) // page_size * page_size
+    col1, col2, col3 = st.columns([1, 3, 1])
+    with col1:
+        st.button(
+            "◀ Prev", key=f"{key}_prev", on_click=move_to, args=(start - page_size,),
+            disabled=start == 0, use_container_width=True
+        )
+    with col2:
+        end = min(start + page_size, total)
+        st.caption(f"Showing {start + 1:,}–{end:,} of {total:,} · page {start // page_size + 1} of {last_start // page_size + 1}")
+    with col3:
+        st.button(
+            "Next ▶", key=f"{key}_next", on_click=move_to, args=(start + page_size,),
+            disabled=start + page_size >= total, use_container_width=True
+        )
+
 # =========================
 # DASHBOARD PAGE
 # =========================
@@ -667,12 +2467,14 @@ def render_dashboard_page():
     
     # Load data
     with st.spinner("Loading dashboard data..."):
-        df = read_sheets_data(sheets_service)
+        df = get_recordings_snapshot(sheets_service)
     
     if df.empty:
         st.info("📭 No recordings yet. Go to the Record page!")
         return
     
+    metrics = get_recording_metrics(df)
+    
     # Metrics Row
     st.subheader("📈 Key Metrics")
     col1, col2, col3, col4, col5, col6 = st.columns(6)
@@ -680,78 +2482,52 @@ def render_dashboard_page():
     with col1:
         st.markdown(f"""
         <div class="metric-card metric-card-blue">
-            <h1>{len(df)}</h1>
+            <h1>{metrics['total']}</h1>
             <p>Total Recordings</p>
         </div>
         """, unsafe_allow_html=True)
     
     with col2:
-        if 'Words' in df.columns:
-            try:
-                total_words = df['Words'].astype(str).str.replace(',', '').replace('', '0')
-                total_words = pd.to_numeric(total_words, errors='coerce').fillna(0).sum()
-                st.markdown(f"""
-                <div class="metric-card metric-card-green">
-                    <h1>{int(total_words):,}</h1>
-                    <p>Total Words</p>
-                </div>
-                """, unsafe_allow_html=True)
-            except:
-                st.metric("Total Words", "N/A")
+        st.markdown(f"""
+        <div class="metric-card metric-card-green">
+            <h1>{metrics['total_words']:,}</h1>
+            <p>Total Words</p>
+        </div>
+        """, unsafe_allow_html=True)
     
     with col3:
-        if 'Category' in df.columns:
-            unique_cats = df['Category'].nunique()
-            st.markdown(f"""
-            <div class="metric-card metric-card-orange">
-                <h1>{unique_cats}</h1>
-                <p>Categories</p>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown(f"""
+        <div class="metric-card metric-card-orange">
+            <h1>{metrics['unique_categories']}</h1>
+            <p>Categories</p>
+        </div>
+        """, unsafe_allow_html=True)
     
     with col4:
-        try:
-            today = datetime.now().strftime('%Y-%m-%d')
-            today_count = df['Timestamp'].str.contains(today, na=False).sum()
-            st.markdown(f"""
-            <div class="metric-card metric-card-purple">
-                <h1>{today_count}</h1>
-                <p>Today</p>
-            </div>
-            """, unsafe_allow_html=True)
-        except:
-            st.metric("Today", "0")
+        st.markdown(f"""
+        <div class="metric-card metric-card-purple">
+            <h1>{metrics['today']}</h1>
+            <p>Today</p>
+        </div>
+        """, unsafe_allow_html=True)
     
     with col5:
         # Average words per recording
-        if 'Words' in df.columns:
-            try:
-                words = df['Words'].astype(str).str.replace(',', '').replace('', '0')
-                words = pd.to_numeric(words, errors='coerce').fillna(0)
-                avg_words = int(words.mean())
-                st.markdown(f"""
-                <div class="metric-card metric-card-red">
-                    <h1>{avg_words:,}</h1>
-                    <p>Avg Words</p>
-                </div>
-                """, unsafe_allow_html=True)
-            except:
-                pass
+        st.markdown(f"""
+        <div class="metric-card metric-card-red">
+            <h1>{metrics['avg_words']:,}</h1>
+            <p>Avg Words</p>
+        </div>
+        """, unsafe_allow_html=True)
     
     with col6:
         # This week's recordings
-        try:
-            from datetime import timedelta
-            week_ago = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
-            week_count = df['Timestamp'].apply(lambda x: x >= week_ago if isinstance(x, str) else False).sum()
-            st.markdown(f"""
-            <div class="metric-card metric-card-yellow">
-                <h1>{week_count}</h1>
-                <p>This Week</p>
-            </div>
-            """, unsafe_allow_html=True)
-        except:
-            pass
+        st.markdown(f"""
+        <div class="metric-card metric-card-yellow">
+            <h1>{metrics['this_week']}</h1>
+            <p>This Week</p>
+        </div>
+        """, unsafe_allow_html=True)
     
     st.divider()
     
@@ -761,11 +2537,10 @@ def render_dashboard_page():
     with col1:
         if 'Category' in df.columns:
             st.subheader("📂 Category Distribution")
-            category_counts = df['Category'].value_counts()
             
-            for cat, count in category_counts.items():
+            for cat, count in metrics["category_counts"].items():
                 badge_class = f"badge-{cat.lower().replace(' ', '')}"
-                percentage = (count / len(df)) * 100
+                percentage = (count / metrics['total']) * 100
                 st.markdown(f"""
                 <div style="margin: 10px 0;">
                     <span class="category-badge {badge_class}">{cat}</span>
@@ -794,8 +2569,7 @@ def render_dashboard_page():
     view_col1, view_col2, view_col3, view_col4 = st.columns([1, 1, 1, 3])
     with view_col1:
         if st.button("🔄 Refresh", use_container_width=True):
-            st.cache_resource.clear()
-            st.cache_data.clear()
+            refresh_recordings()
             st.rerun()
     
     with view_col2:
@@ -806,7 +2580,7 @@ def render_dashboard_page():
         )
     
     with view_col3:
-        csv = df.drop('Row', axis=1).to_csv(index=False)
+        csv = df[config.SHEET_HEADERS].to_csv(index=False)
         st.download_button(
             "📥 Export CSV",
             csv,
@@ -824,8 +2598,8 @@ def render_dashboard_page():
 def render_data_table(df, sheets_service, drive_service):
     """Render data as an interactive table with edit/delete/play"""
     
-    # Make a copy for display
-    display_df = df.drop('Row', axis=1) if 'Row' in df.columns else df
+    page_df = paginate(df, "dashboard_table")
+    display_df = page_df[config.SHEET_HEADERS]
     
     # Display the dataframe
     st.dataframe(
@@ -843,6 +2617,12 @@ def render_data_table(df, sheets_service, drive_service):
         }
     )
     
+    render_bulk_actions(page_df, sheets_service, key="dashboard")
+    render_table_actions(df, sheets_service, drive_service)
+
+@st.fragment
+def render_table_actions(df, sheets_service, drive_service):
+    """Render the row action bar, inline player and edit form below the table as one fragment"""
     # Action buttons below table
     st.divider()
     st.subheader("🎯 Actions")
@@ -861,29 +2641,32 @@ def render_data_table(df, sheets_service, drive_service):
     with action_col2:
         btn_col1, btn_col2, btn_col3, btn_col4 = st.columns(4)
         
+        row_data = df[df['Row'] == selected_row]
+        
         with btn_col1:
-            if st.button("🎵 Play Audio", use_container_width=True, type="primary"):
-                row_data = df[df['Row'] == selected_row]
-                if not row_data.empty:
-                    st.session_state.selected_recording = row_data.iloc[0].to_dict()
-                    st.rerun()
+            st.button(
+                "🎵 Play Audio", use_container_width=True, type="primary",
+                on_click=lambda: st.session_state.update(
+                    selected_recording=row_data.iloc[0].to_dict() if not row_data.empty else None
+                )
+            )
         
         with btn_col2:
-            if st.button("✏️ Edit Row", use_container_width=True):
-                st.session_state.edit_mode = True
-                st.session_state.edit_row = selected_row
-                st.rerun()
+            st.button(
+                "✏️ Edit Row", use_container_width=True,
+                on_click=lambda: st.session_state.update(
+                    edit_mode=True, edit_key=row_data.iloc[0]['Key'] if not row_data.empty else None
+                )
+            )
         
         with btn_col3:
             if st.button("🗑️ Delete Row", use_container_width=True):
-                if delete_sheet_row(sheets_service, selected_row):
+                old_data = sheet_row_values(row_data.iloc[0]) if not row_data.empty else None
+                if delete_sheet_row(sheets_service, selected_row, old_data):
                     st.success(f"✅ Deleted row {selected_row}")
-                    st.cache_resource.clear()
-                    st.cache_data.clear()
                     st.rerun()
         
         with btn_col4:
-            row_data = df[df['Row'] == selected_row]
             if not row_data.empty:
                 doc_link = row_data.iloc[0].get('Sheet Link', '')
                 if doc_link and doc_link.strip():
@@ -911,21 +2694,18 @@ def render_data_table(df, sheets_service, drive_service):
             </div>
             """, unsafe_allow_html=True)
         
-        if st.button("❌ Close Player"):
-            st.session_state.selected_recording = None
-            st.rerun()
+        st.button("❌ Close Player", on_click=lambda: st.session_state.update(selected_recording=None))
     
     # Edit form
-    if st.session_state.get('edit_mode') and st.session_state.get('edit_row'):
+    if st.session_state.get('edit_mode') and st.session_state.get('edit_key'):
         render_edit_form(df, sheets_service)
 
 def render_edit_form(df, sheets_service):
-    """Render edit form for a specific row"""
+    """Render edit form for a specific row (inside the render_table_actions fragment)"""
     st.divider()
     st.subheader("✏️ Edit Recording")
     
-    row_num = st.session_state.edit_row
-    row_data = df[df['Row'] == row_num]
+    row_data = df[df['Key'] == st.session_state.edit_key]
     
     if row_data.empty:
         st.error("Row not found")
@@ -944,7 +2724,7 @@ def render_edit_form(df, sheets_service):
             new_duration = st.text_input("Duration", value=row_data['Duration'])
         
         with col2:
-            new_words = st.text_input("Words", value=row_data['Words'])
+            new_words = st.text_input("Words", value=str(row_data['Words']))
             new_drive_link = st.text_input("Drive Link", value=row_data['Drive Link'])
             new_doc_link = st.text_input("Doc Link", value=row_data['Sheet Link'])
         
@@ -954,7 +2734,10 @@ def render_edit_form(df, sheets_service):
             submitted = st.form_submit_button("💾 Save Changes", use_container_width=True, type="primary")
         
         with submit_col2:
-            cancelled = st.form_submit_button("❌ Cancel", use_container_width=True)
+            st.form_submit_button(
+                "❌ Cancel", use_container_width=True,
+                on_click=lambda: st.session_state.update(edit_mode=False, edit_key=None)
+            )
         
         if submitted:
             new_data = [
@@ -968,22 +2751,18 @@ def render_edit_form(df, sheets_service):
                 new_doc_link
             ]
             
-            if update_sheet_row(sheets_service, row_num, new_data):
+            if update_sheet_row(sheets_service, row_data['Row'], new_data, sheet_row_values(row_data)):
                 st.success("✅ Updated successfully!")
                 st.session_state.edit_mode = False
-                st.session_state.edit_row = None
-                st.cache_resource.clear()
-                st.cache_data.clear()
+                st.session_state.edit_key = None
                 st.rerun()
-        
-        if cancelled:
-            st.session_state.edit_mode = False
-            st.session_state.edit_row = None
-            st.rerun()
 
 def render_data_cards(df, sheets_service, drive_service):
     """Render data as colorful cards with inline playback"""
-    for idx, row in df.iterrows():
+    page_df = paginate(df, "dashboard_cards")
+    render_bulk_actions(page_df, sheets_service, key="dashboard")
+    
+    for idx, row in page_df.iterrows():
         category_class = f"badge-{row['Category'].lower().replace(' ', '')}"
         
         with st.expander(f"🎙️ {row['Title']}", expanded=False):
@@ -999,11 +2778,15 @@ def render_data_cards(df, sheets_service, drive_service):
             col3.write(f"**⏱️ Duration:** {row['Duration']}")
             col4.write(f"**📁 File:** {row['Filename']}")
             
+            drive_summary = cached_drive_file_summary(row.get('File ID'))
+            if drive_summary:
+                st.caption(drive_summary)
+            
             st.divider()
             
             # Audio player
             if row.get('Drive Link') and row['Drive Link'].strip():
-                play_audio_inline(row['Drive Link'], drive_service, row['Title'])
+                play_audio_on_demand(row['Drive Link'], drive_service, row['Title'], key=f"card_{row['Key']}")
             
             st.divider()
             
@@ -1019,16 +2802,73 @@ def render_data_cards(df, sheets_service, drive_service):
                     st.link_button("📄 View Doc", row['Sheet Link'], use_container_width=True)
             
             with btn_col3:
-                if st.button(f"🗑️ Delete", key=f"del_{row['Row']}", use_container_width=True):
-                    if delete_sheet_row(sheets_service, row['Row']):
+                if st.button(f"🗑️ Delete", key=f"del_{row['Key']}", use_container_width=True):
+                    if delete_sheet_row(sheets_service, row['Row'], sheet_row_values(row)):
                         st.success(f"✅ Deleted!")
-                        st.cache_resource.clear()
-                        st.cache_data.clear()
                         st.rerun()
 
+def render_bulk_actions(df, sheets_service, key):
+    """Render multi-select bulk delete / recategorize over the visible page, backed by one batchUpdate"""
+    with st.expander("🧹 Bulk Actions", expanded=False):
+        labels = {key: f"#{row} · {title}" for key, row, title in zip(df['Key'], df['Row'], df['Title'])}
+        selected_keys = st.multiselect(
+            "Select recordings on this page",
+            options=list(labels),
+            format_func=labels.get,
+            key=f"{key}_bulk_rows"
+        )
+        
+        col1, col2, col3 = st.columns([2, 1, 1])
+        with col1:
+            new_category = st.selectbox(
+                "New category",
+                config.CATEGORIES,
+                key=f"{key}_bulk_category",
+                label_visibility="collapsed"
+            )
+        
+        with col2:
+            recategorize = st.button(
+                "🏷️ Set Category",
+                key=f"{key}_bulk_recategorize",
+                disabled=not selected_keys,
+                use_container_width=True
+            )
+        
+        with col3:
+            delete = st.button(
+                "🗑️ Delete Selected",
+                key=f"{key}_bulk_delete",
+                disabled=not selected_keys,
+                use_container_width=True
+            )
+        
+        if not (recategorize or delete):
+            return
+        
+        batch = SheetMutationBatch(sheets_service)
+        for _, row in df[df['Key'].isin(selected_keys)].iterrows():
+            if delete:
+                batch.delete(row['Row'], sheet_row_values(row))
+            else:
+                old_values = sheet_row_values(row)
+                new_values = list(old_values)
+                new_values[config.SHEET_HEADERS.index('Category')] = new_category
+                batch.update(row['Row'], old_values, new_values)
+        
+        if batch.flush():
+            action = "Deleted" if delete else "Recategorized"
+            st.success(f"✅ {action} {len(selected_keys)} recordings")
+            # Row numbers shift after a delete, so drop the stale selection
+            del st.session_state[f"{key}_bulk_rows"]
+            st.rerun()
+
 # =========================
 # PLAYER PAGE
 # =========================
+# Columns the playlist renders; Filename is only shown in Now Playing
+PLAYLIST_HEADERS = ('Timestamp', 'Title', 'Category', 'Duration', 'Words', 'Drive Link', 'Sheet Link')
+
 def render_player_page():
     """Render dedicated audio player page"""
     st.title("🎵 Audio Player")
@@ -1041,9 +2881,21 @@ def render_player_page():
         st.info("👈 Upload your service_account.json in the sidebar")
         st.stop()
     
-    df = read_sheets_data(sheets_service)
+    # Reading the sheet directly, the unfiltered playlist pages over the grid and loads only the visible rows
+    windowed = not get_active_mirror()
+    if windowed:
+        credentials_key = get_credentials_key()
+        version = get_snapshot_key()[1:]
+        try:
+            total = get_sheet_row_count(sheets_service, config.GOOGLE_SHEETS_ID, credentials_key, version)
+        except Exception as e:
+            st.error(f"Error reading sheets: {e}")
+            return
+    else:
+        df = get_recordings_snapshot(sheets_service)
+        total = len(df)
     
-    if df.empty:
+    if not total:
         st.info("📭 No recordings yet")
         return
     
@@ -1053,30 +2905,68 @@ def render_player_page():
     # Filter controls
     col1, col2 = st.columns([1, 2])
     with col1:
-        if 'Category' in df.columns:
-            category_filter = st.multiselect(
-                "Filter by Category",
-                options=['All'] + sorted(df['Category'].unique().tolist()),
-                default=['All']
-            )
+        category_filter = st.multiselect(
+            "Filter by Category",
+            options=['All'] + (list(config.CATEGORIES) if windowed else sorted(df['Category'].unique().tolist())),
+            default=['All']
+        )
     
     with col2:
         search = st.text_input("🔍 Search titles", "")
+        search_transcripts_too = config.ENABLE_TRANSCRIPT_SEARCH and st.checkbox(
+            "Search transcripts", key="player_transcript_search",
+            help='Use "quotes" for phrases and word* for prefixes'
+        )
     
     # Apply filters
-    filtered_df = df.copy()
-    if category_filter and 'All' not in category_filter:
-        filtered_df = filtered_df[filtered_df['Category'].isin(category_filter)]
-    
-    if search:
-        filtered_df = filtered_df[filtered_df['Title'].str.contains(search, case=False, na=False)]
-    
-    st.write(f"**{len(filtered_df)} recordings available**")
+    categories = category_filter if category_filter and 'All' not in category_filter else None
+    windowed = windowed and not categories and not search
+    if not windowed:
+        df = get_recordings_snapshot(sheets_service)
+        if search_transcripts_too and search:
+            backfill_transcript_index(df)
+            filtered_df = search_transcripts(query_recordings(df, categories), search)
+        else:
+            filtered_df = query_recordings(df, categories, search)
+        st.write(f"**{len(filtered_df)} recordings available**")
     
     st.divider()
     
     # Playlist with play buttons
-    for idx, row in filtered_df.iterrows():
+    if windowed:
+        start_row = paginate_sheet(total, "player")
+        try:
+            page_df = fetch_sheet_window(
+                sheets_service, config.GOOGLE_SHEETS_ID, credentials_key, version,
+                start_row, config.RECORDINGS_PER_PAGE, PLAYLIST_HEADERS
+            )
+        except Exception as e:
+            st.error(f"Error reading sheets: {e}")
+            return
+        if page_df.empty:
+            # The grid can end in blank rows, so the last pages may hold no recordings
+            st.info("📭 No recordings on this page")
+            return
+        remember_visible_files(page_df)
+    else:
+        page_df = paginate(filtered_df, "player", view=(categories, search, search_transcripts_too))
+    render_playlist(page_df, sheets_service, drive_service, windowed)
+
+def start_playing(recording, sheets_service, windowed):
+    """Play button callback: put the recording in Now Playing"""
+    st.session_state.playing_audio = recording
+    if windowed:
+        # The playlist window skips Filename; fetch the whole row for Now Playing
+        try:
+            full_row = build_recordings_frame(read_sheet_window(sheets_service, recording['Row'], 1), [recording['Row']])
+            st.session_state.playing_audio = full_row.iloc[0].to_dict()
+        except Exception:
+            pass
+
+@st.fragment
+def render_playlist(page_df, sheets_service, drive_service, windowed):
+    """Render the playlist page and Now Playing panel as one fragment"""
+    for idx, row in page_df.iterrows():
         category_class = f"badge-{row['Category'].lower().replace(' ', '')}"
         
         col1, col2, col3 = st.columns([3, 1, 1])
@@ -1091,15 +2981,21 @@ def render_player_page():
                 </p>
             </div>
             """, unsafe_allow_html=True)
+            drive_summary = cached_drive_file_summary(row.get('File ID'))
+            if drive_summary:
+                st.caption(drive_summary)
+            if row.get('Snippet'):
+                st.markdown(f"> {highlight_snippet(row['Snippet'])}", unsafe_allow_html=True)
         
         with col2:
-            if st.button(f"▶️ Play", key=f"play_{row['Row']}", use_container_width=True, type="primary"):
-                st.session_state.playing_audio = row.to_dict()
-                st.rerun()
+            st.button(
+                f"▶️ Play", key=f"play_{row['Key']}", use_container_width=True, type="primary",
+                on_click=start_playing, args=(row.to_dict(), sheets_service, windowed)
+            )
         
         with col3:
             if row.get('Sheet Link') and row['Sheet Link'].strip():
-                st.link_button("📄 Doc", row['Sheet Link'], use_container_width=True, key=f"doc_{row['Row']}")
+                st.link_button("📄 Doc", row['Sheet Link'], use_container_width=True, key=f"doc_{row['Key']}")
     
     # Now Playing section
     if st.session_state.get('playing_audio'):
@@ -1107,7 +3003,7 @@ def render_player_page():
         render_now_playing(drive_service)
 
 def render_now_playing(drive_service):
-    """Render now playing section"""
+    """Render now playing section (inside the render_playlist fragment)"""
     recording = st.session_state.playing_audio
     
     st.subheader("🎵 Now Playing")
@@ -1144,9 +3040,10 @@ def render_now_playing(drive_service):
         if recording.get('Drive Link') and recording['Drive Link'].strip():
             st.link_button("🔗 Open in Drive", recording['Drive Link'], use_container_width=True)
         
-        if st.button("❌ Stop Playing", use_container_width=True):
-            st.session_state.playing_audio = None
-            st.rerun()
+        st.button(
+            "❌ Stop Playing", use_container_width=True,
+            on_click=lambda: st.session_state.update(playing_audio=None)
+        )
 
 # =========================
 # RECORD PAGE
@@ -1255,61 +3152,527 @@ def render_record_page():
     if st.session_state.submitted and st.session_state.audio_bytes:
         process_transcription()
 
+    # Job status / results
+    job_id = st.session_state.job_id or st.query_params.get("job")
+    if job_id and not st.session_state.transcription:
+        job = get_job_queue().get(job_id)
+        if job is None:
+            st.query_params.pop("job", None)
+            st.session_state.job_id = None
+        elif job["state"] == "done":
+            attach_job_result(job)
+        elif job["state"] == "failed":
+            st.error(f"❌ Transcription failed: {job['error']}")
+            if st.button("🔄 Start Over", use_container_width=True):
+                reset_session()
+        else:
+            st.session_state.job_id = job_id
+            render_job_status(job_id)
+
     # Display Results
     if st.session_state.transcription:
         display_transcription_results()
 
-def process_transcription():
-    """Handle the transcription process"""
-    progress = st.progress(0)
-    status = st.empty()
+class MultipartStream:
+    """File-like multipart/form-data body that reads the audio part lazily"""
+    
+    def __init__(self, fields, file_field, filename, file_obj, content_type):
+        boundary = secrets.token_hex(16)
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        
+        safe_filename = filename.replace('"', '%22')
+        head = "".join(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'
+            for name, value in fields.items()
+        )
+        head += (
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{file_field}"; '
+            f'filename="{safe_filename}"\r\nContent-Type: {content_type}\r\n\r\n'
+        )
+        tail = f"\r\n--{boundary}--\r\n"
+        
+        self.parts = [io.BytesIO(head.encode("utf-8")), file_obj, io.BytesIO(tail.encode("utf-8"))]
+        self.length = len(head.encode("utf-8")) + get_file_size(file_obj) + len(tail.encode("utf-8"))
+    
+    def __len__(self):
+        return self.length
+    
+    def read(self, size=-1):
+        while self.parts:
+            chunk = self.parts[0].read(size)
+            if chunk:
+                return chunk
+            self.parts.pop(0)
+        return b""
 
-    try:
-        status.info("🔄 Encoding audio (this may take time for very large files)…")
-        progress.progress(20)
+def get_file_size(file_obj):
+    """Return the bytes remaining in a seekable file without reading it"""
+    position = file_obj.tell()
+    size = file_obj.seek(0, os.SEEK_END) - position
+    file_obj.seek(position)
+    return size
 
-        audio_b64 = base64.b64encode(st.session_state.audio_bytes).decode("utf-8")
+class SentNotifier:
+    """Request body wrapper that calls `on_sent` once requests has read the body to the end"""
+    
+    def __init__(self, body, on_sent):
+        self.body = body
+        self.on_sent = on_sent
+        self.length = len(body) if hasattr(body, "__len__") else get_file_size(body)
+    
+    def __len__(self):
+        return self.length
+    
+    def read(self, size=-1):
+        chunk = self.body.read(size)
+        if not chunk:
+            self.on_sent()
+        return chunk
 
-        payload = {
-            "title": st.session_state.title,
-            "category": st.session_state.category,
-            "filename": st.session_state.filename,
-            "audioData": audio_b64,
-            "language": "en",
+def build_transcription_request(metadata, audio_file, filename):
+    """Build requests.post keyword arguments for config.WEBHOOK_TRANSFER_MODE"""
+    mode = config.WEBHOOK_TRANSFER_MODE
+    content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    
+    if mode == "multipart":
+        body = MultipartStream(metadata, "audio", filename, audio_file, content_type)
+        return {"data": body, "headers": {"Content-Type": body.content_type}}
+    
+    if mode == "binary":
+        # Raw audio body streamed from the file, metadata in the query string
+        return {
+            "data": audio_file,
+            "params": metadata,
+            "headers": {"Content-Type": content_type, "Content-Length": str(get_file_size(audio_file))},
         }
+    
+    if mode == "json":
+        payload = dict(metadata, audioData=base64.b64encode(audio_file.read()).decode("utf-8"))
+        # Sent as a file-like body like the other modes, so the end of the upload can be observed
+        return {"data": io.BytesIO(json.dumps(payload).encode("utf-8")), "headers": {"Content-Type": "application/json"}}
+    
+    raise ValueError(f"Unknown WEBHOOK_TRANSFER_MODE: {mode}")
+
+# =========================
+# TRANSCRIPTION JOBS
+# =========================
+TERMINAL_JOB_STATES = ("done", "failed")
+JOB_ID_PATTERN = re.compile(r"[0-9a-f]{32}")
 
-        status.info("📡 Sending audio to transcription engine…")
-        progress.progress(50)
+class WebhookError(Exception):
+    """Raised when the transcription webhook answers with a non-200 status"""
 
-        response = requests.post(
-            config.N8N_WEBHOOK_URL,
-            json=payload,
-            headers={"Content-Type": "application/json"},
-            timeout=config.REQUEST_TIMEOUT,
-        )
+def create_webhook_session():
+    """Build a keep-alive HTTP session with a connection pool sized for webhook traffic"""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=config.WEBHOOK_POOL_SIZE,
+        pool_maxsize=config.WEBHOOK_POOL_SIZE,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
-        progress.progress(85)
+def webhook_backoff(attempt, response=None):
+    """Seconds to wait before a retry: exponential with full jitter, or Retry-After"""
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), config.WEBHOOK_BACKOFF_MAX)
+    return random.uniform(0, min(config.WEBHOOK_BACKOFF_MAX, config.WEBHOOK_BACKOFF_BASE * 2 ** attempt))
 
-        if response.status_code == 200:
-            data = response.json()
-            st.session_state.transcription = data.get("transcription", "")
-            st.session_state.response_data = data
-            status.success("✅ Transcription completed successfully!")
-            progress.progress(100)
-        else:
-            st.error(f"❌ Transcription failed (Status: {response.status_code})")
-            st.code(response.text)
+def post_transcription(session, metadata, audio_file, filename, idempotency_key, on_sent=None, url=None):
+    """POST audio to the webhook (default config.N8N_WEBHOOK_URL), retrying transient failures, and return its JSON"""
+    start = audio_file.tell()
+    for attempt in range(config.WEBHOOK_MAX_RETRIES + 1):
+        audio_file.seek(start)
+        request_kwargs = build_transcription_request(metadata, audio_file, filename)
+        request_kwargs["headers"]["Idempotency-Key"] = idempotency_key
+        if on_sent:
+            request_kwargs["data"] = SentNotifier(request_kwargs["data"], on_sent)
+        last_attempt = attempt == config.WEBHOOK_MAX_RETRIES
+        
+        try:
+            response = session.post(url or config.N8N_WEBHOOK_URL, timeout=config.REQUEST_TIMEOUT, **request_kwargs)
+        except requests.exceptions.ConnectionError:
+            if last_attempt:
+                raise
+            time.sleep(webhook_backoff(attempt))
+            continue
+        
+        if response.status_code in config.WEBHOOK_RETRY_STATUSES and not last_attempt:
+            time.sleep(webhook_backoff(attempt, response))
+            continue
+        if response.status_code != 200:
+            raise WebhookError(f"Status {response.status_code}: {response.text[:2000]}")
+        return response.json()
+
+def find_quietest_frame(wav, start, end, frame_rate):
+    """Return the frame in [start, end) whose 50 ms neighbourhood has the least energy"""
+    window = max(int(frame_rate * 0.05), 1)
+    wav.setpos(start)
+    samples = array('h', wav.readframes(end - start))
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    
+    channels = wav.getnchannels()
+    step = window * channels
+    best_frame, best_energy = end, None
+    for offset in range(0, len(samples) - step + 1, step):
+        energy = sum(map(abs, samples[offset:offset + step]))
+        if best_energy is None or energy < best_energy:
+            best_frame, best_energy = start + offset // channels + window // 2, energy
+    return best_frame
+
+def plan_wav_segments(audio_path):
+    """Return (frame_rate, [(start_frame, end_frame)]) cut at quiet points, or None if not a long WAV"""
+    try:
+        with wave.open(audio_path, 'rb') as wav:
+            frame_rate = wav.getframerate()
+            n_frames = wav.getnframes()
+            if n_frames < config.SEGMENT_MIN_SECONDS * frame_rate:
+                return None
+            
+            segment = int(config.SEGMENT_SECONDS * frame_rate)
+            overlap = int(config.SEGMENT_OVERLAP_SECONDS * frame_rate)
+            search = min(int(config.SEGMENT_SILENCE_SEARCH_SECONDS * frame_rate), segment // 2)
+            
+            segments = []
+            start = 0
+            while start + segment < n_frames:
+                nominal = start + segment
+                if wav.getsampwidth() == 2:
+                    cut = find_quietest_frame(wav, nominal - search, nominal, frame_rate)
+                else:
+                    cut = nominal
+                segments.append((start, min(cut + overlap, n_frames)))
+                start = cut
+            segments.append((start, n_frames))
+            return frame_rate, segments
+    except (wave.Error, EOFError):
+        return None
+
+def write_wav_segment(src_path, start, end, dest_path):
+    """Copy frames [start, end) of a WAV file into a standalone WAV file"""
+    with wave.open(src_path, 'rb') as src, wave.open(dest_path, 'wb') as dst:
+        dst.setparams(src.getparams())
+        src.setpos(start)
+        block = src.getframerate() * 10
+        remaining = end - start
+        while remaining > 0:
+            frames = src.readframes(min(block, remaining))
+            if not frames:
+                break
+            dst.writeframes(frames)
+            remaining -= min(block, remaining)
+
+def stitch_transcripts(parts):
+    """Join segment transcripts, dropping the words repeated across each overlap"""
+    max_overlap = max(20, int(config.SEGMENT_OVERLAP_SECONDS * 6))
+    
+    def normalize(word):
+        return re.sub(r'\W+', '', word.lower())
+    
+    words = []
+    for text in parts:
+        new_words = text.split()
+        tail = [normalize(w) for w in words[-max_overlap:]]
+        head = [normalize(w) for w in new_words[:max_overlap]]
+        
+        overlap = 0
+        for size in range(min(len(tail), len(head)), 1, -1):
+            if tail[-size:] == head[:size]:
+                overlap = size
+                break
+        words.extend(new_words[overlap:])
+    return " ".join(words)
+
+class ProgressReader:
+    """Seekable file wrapper reporting bytes read to a callback"""
+    
+    def __init__(self, file_obj, on_read):
+        self.file_obj = file_obj
+        self.on_read = on_read
+    
+    def read(self, size=-1):
+        chunk = self.file_obj.read(size)
+        self.on_read(len(chunk))
+        return chunk
+    
+    def tell(self):
+        return self.file_obj.tell()
+    
+    def seek(self, offset, whence=os.SEEK_SET):
+        return self.file_obj.seek(offset, whence)
+
+class TranscriptionJobQueue:
+    """Worker pool running webhook transcriptions, with jobs persisted under config.JOBS_DIR"""
+    
+    def __init__(self, directory, workers, on_done=None):
+        self.directory = directory
+        self.on_done = on_done  # called with the finished job record
+        self.lock = threading.Lock()
+        self.bytes_sent = {}  # job_id -> bytes uploaded so far (kept in memory only)
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="transcription")
+        self.session = create_webhook_session()
+        os.makedirs(directory, exist_ok=True)
+        self._prune()
+        self._resume()
+    
+    def _record_path(self, job_id):
+        return os.path.join(self.directory, f"{job_id}.json")
+    
+    def _audio_path(self, job_id):
+        return os.path.join(self.directory, f"{job_id}.audio")
+    
+    def _save(self, job):
+        tmp_path = self._record_path(job["id"]) + ".tmp"
+        with open(tmp_path, "w") as fh:
+            json.dump(job, fh)
+        os.replace(tmp_path, self._record_path(job["id"]))
+    
+    def _load(self, job_id):
+        try:
+            with open(self._record_path(job_id)) as fh:
+                return json.load(fh)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+    
+    def _update(self, job_id, **changes):
+        with self.lock:
+            job = self._load(job_id)
+            job.update(changes, updated_at=time.time())
+            self._save(job)
+            return job
+    
+    def _prune(self):
+        """Delete finished job records older than config.JOB_RETENTION"""
+        cutoff = time.time() - config.JOB_RETENTION
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            job = self._load(name[:-len(".json")])
+            if job and job.get("state") in TERMINAL_JOB_STATES and job.get("updated_at", 0) < cutoff:
+                os.remove(os.path.join(self.directory, name))
+    
+    def _resume(self):
+        """Re-queue jobs interrupted by a restart, failing those whose audio is gone"""
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            job = self._load(name[:-len(".json")])
+            if not job or job["state"] in TERMINAL_JOB_STATES:
+                continue
+            if os.path.exists(self._audio_path(job["id"])):
+                self._update(job["id"], state="queued")
+                self.executor.submit(self._run, job["id"])
+            else:
+                self._update(job["id"], state="failed", error="Audio was lost before the job finished")
+    
+    def submit(self, metadata, audio_file):
+        """Spool the audio to disk, queue the job and return its ID immediately"""
+        with self.lock:
+            self._prune()
+        job_id = uuid.uuid4().hex
+        tmp_path = self._audio_path(job_id) + ".tmp"
+        with open(tmp_path, "wb") as fh:
+            shutil.copyfileobj(audio_file, fh)
+        os.replace(tmp_path, self._audio_path(job_id))
+        
+        now = time.time()
+        job = {
+            "id": job_id,
+            "state": "queued",
+            "metadata": metadata,
+            "bytes_total": os.path.getsize(self._audio_path(job_id)),
+            "result": None,
+            "error": None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        with self.lock:
+            self._save(job)
+        self.executor.submit(self._run, job_id)
+        return job_id
+    
+    def get(self, job_id):
+        """Return the job record, including live upload progress, or None"""
+        # IDs arrive from the query string; anything else must not reach the filesystem
+        if not isinstance(job_id, str) or not JOB_ID_PATTERN.fullmatch(job_id):
+            return None
+        with self.lock:
+            job = self._load(job_id)
+        if job:
+            job["bytes_sent"] = self.bytes_sent.get(job_id, job["bytes_total"] if job["state"] != "queued" else 0)
+        return job
+    
+    def _run(self, job_id):
+        job = self._update(job_id, state="uploading")
+        audio_path = self._audio_path(job_id)
+        
+        try:
+            # Binary mode carries metadata in the query string, which cannot hold a long transcript
+            segmented = (
+                config.ENABLE_SEGMENTED_TRANSCRIPTION and config.SEGMENT_WEBHOOK_URL
+                and config.WEBHOOK_TRANSFER_MODE != "binary"
+            )
+            plan = plan_wav_segments(audio_path) if segmented else None
+            if plan:
+                result = self._transcribe_segments(job, audio_path, *plan)
+            else:
+                result = self._transcribe_whole(job, audio_path)
+            job = self._update(job_id, state="done", result=result)
+            if self.on_done:
+                try:
+                    self.on_done(job)
+                except Exception:
+                    pass  # the transcription itself succeeded
+        except WebhookError as e:
+            self._update(job_id, state="failed", error=str(e))
+        except requests.exceptions.Timeout:
+            self._update(job_id, state="failed", error="Request timed out. Try a smaller file or increase timeout.")
+        except requests.exceptions.ConnectionError:
+            self._update(job_id, state="failed", error="Connection error. Check your network and n8n webhook URL.")
+        except Exception as e:
+            self._update(job_id, state="failed", error=f"Unexpected error: {e}")
+        finally:
+            self.bytes_sent.pop(job_id, None)
+            if os.path.exists(audio_path):
+                os.remove(audio_path)
+    
+    def _transcribe_whole(self, job, audio_path, metadata=None):
+        """Send the full recording in one webhook request"""
+        job_id = job["id"]
+        metadata = metadata or job["metadata"]
+        self.bytes_sent[job_id] = 0
+        
+        def on_read(size):
+            # Position-based so a retried upload restarts the count instead of overshooting
+            self.bytes_sent[job_id] = fh.tell()
+        
+        def on_sent():
+            # The whole body is on the wire; the webhook is transcribing now
+            if job["state"] == "uploading":
+                job["state"] = "transcribing"
+                self._update(job_id, state="transcribing")
+        
+        with open(audio_path, "rb") as fh:
+            return post_transcription(
+                self.session, metadata, ProgressReader(fh, on_read), metadata["filename"], job_id, on_sent
+            )
+    
+    def _transcribe_segments(self, job, audio_path, frame_rate, segments):
+        """Transcribe overlapping WAV segments concurrently, then store the stitched result once"""
+        job_id = job["id"]
+        metadata = job["metadata"]
+        stem = os.path.splitext(metadata["filename"])[0]
+        progress_lock = threading.Lock()
+        done = [0]
+        self._update(job_id, state="transcribing", segments_total=len(segments), segments_done=0)
+        
+        def transcribe_segment(index):
+            start, end = segments[index]
+            segment_path = os.path.join(self.directory, f"{job_id}.part{index:03d}.wav")
+            try:
+                write_wav_segment(audio_path, start, end, segment_path)
+                segment_metadata = dict(
+                    metadata,
+                    jobId=job_id,
+                    segmentIndex=index,
+                    segmentCount=len(segments),
+                    segmentOffset=round(start / frame_rate, 3),
+                )
+                with open(segment_path, "rb") as fh:
+                    data = post_transcription(
+                        self.session, segment_metadata, fh, f"{stem}.part{index:03d}.wav", f"{job_id}-{index}",
+                        url=config.SEGMENT_WEBHOOK_URL
+                    )
+            finally:
+                if os.path.exists(segment_path):
+                    os.remove(segment_path)
+            
+            with progress_lock:
+                done[0] += 1
+                self._update(job_id, segments_done=done[0])
+            return data
+        
+        with ThreadPoolExecutor(max_workers=config.SEGMENT_WORKERS, thread_name_prefix=f"segment-{job_id[:8]}") as pool:
+            results = list(pool.map(transcribe_segment, range(len(segments))))
+        
+        transcription = stitch_transcripts([r.get("transcription", "") for r in results])
+        
+        # The full recording goes through the storing webhook once, carrying the finished transcript
+        job["state"] = "uploading"
+        self._update(job_id, state="uploading")
+        result = self._transcribe_whole(job, audio_path, dict(metadata, transcription=transcription))
+        return dict(result, transcription=result.get("transcription") or transcription, segments=len(segments))
+
+@st.cache_resource
+def get_job_queue():
+    """Process-wide transcription job queue shared by every session"""
+    on_done = get_transcript_index().add_job_result if config.ENABLE_TRANSCRIPT_SEARCH else None
+    return TranscriptionJobQueue(config.JOBS_DIR, config.TRANSCRIPTION_WORKERS, on_done)
 
-    except requests.exceptions.Timeout:
-        st.error("⏱️ Request timed out. Try a smaller file or increase timeout.")
-    except requests.exceptions.ConnectionError:
-        st.error("🔌 Connection error. Check your network and n8n webhook URL.")
+def process_transcription():
+    """Submit the recorded audio as a background job and return immediately"""
+    metadata = {
+        "title": st.session_state.title,
+        "category": st.session_state.category,
+        "filename": st.session_state.filename,
+        "language": "en",
+    }
+    
+    try:
+        job_id = get_job_queue().submit(metadata, io.BytesIO(st.session_state.audio_bytes))
+        st.session_state.job_id = job_id
+        # Keep the job in the URL so a browser refresh can pick the result back up
+        st.query_params["job"] = job_id
+        st.session_state.audio_bytes = None
     except Exception as e:
-        st.error("❌ Unexpected error")
+        st.error("❌ Could not queue transcription")
         st.exception(e)
     finally:
         st.session_state.submitted = False
 
+def attach_job_result(job):
+    """Copy a finished job's transcription into the session"""
+    data = job["result"] or {}
+    st.session_state.transcription = data.get("transcription", "")
+    st.session_state.response_data = data
+    st.session_state.title = job["metadata"]["title"]
+    st.session_state.category = job["metadata"]["category"]
+
+@st.fragment(run_every=config.JOB_POLL_INTERVAL)
+def render_job_status(job_id):
+    """Poll the job queue without re-running the rest of the page"""
+    job = get_job_queue().get(job_id)
+    if not job:
+        st.warning("⚠️ Transcription job not found")
+        return
+    
+    if job["state"] in TERMINAL_JOB_STATES:
+        # Hand over to a full rerun so the results (or error) render outside the fragment
+        st.rerun()
+    
+    uploaded = job["bytes_sent"] / job["bytes_total"] if job["bytes_total"] else 1
+    if job.get("segments_total") and job["segments_done"] < job["segments_total"]:
+        done, total = job["segments_done"], job["segments_total"]
+        st.info(f"📝 Transcribing segment {min(done + 1, total)} of {total}… ({done} done)")
+        st.progress(int(10 + 85 * done / total))
+    elif job["state"] == "queued":
+        st.info("⏳ Waiting for a free transcription worker…")
+        st.progress(0)
+    elif job["state"] == "uploading":
+        st.info(f"📡 Uploading audio… {uploaded:.0%}")
+        st.progress(int(10 + 40 * uploaded))
+    elif job.get("segments_total"):
+        st.info("💾 Saving the stitched transcript…")
+        st.progress(95)
+    else:
+        elapsed = int(time.time() - job["updated_at"])
+        st.info(f"📝 Transcribing… ({elapsed}s)")
+        st.progress(60)
+    st.caption(f"Job `{job_id}` — you can leave this page; the result will be here when you return.")
+
 def display_transcription_results():
     """Display transcription results and actions"""
     st.divider()
@@ -1370,10 +3733,11 @@ def display_transcription_results():
 
 def reset_session():
     """Reset session state for new recording"""
-    keys_to_reset = ["audio_bytes", "transcription", "title", "filename", "stage", "submitted", "response_data"]
+    keys_to_reset = ["audio_bytes", "transcription", "title", "filename", "stage", "submitted", "response_data", "job_id"]
     for key in keys_to_reset:
         st.session_state[key] = None
     st.session_state.category = config.DEFAULT_CATEGORY
+    st.query_params.pop("job", None)
     st.rerun()
 
 # =========================
@@ -1395,13 +3759,13 @@ def render_library_page():
     col1, col2, col3, col4 = st.columns([1, 1, 1, 3])
     with col1:
         if st.button("🔄 Refresh", use_container_width=True):
-            st.cache_resource.clear()
-            st.cache_data.clear()
+            refresh_recordings()
             st.rerun()
     
+    df = get_recordings_snapshot(sheets_service)
+    
     with col2:
-        df = read_sheets_data(sheets_service)
-        csv = df.drop('Row', axis=1).to_csv(index=False) if not df.empty else ""
+        csv = df[config.SHEET_HEADERS].to_csv(index=False) if not df.empty else ""
         st.download_button(
             "📥 Export CSV",
             csv,
@@ -1411,8 +3775,6 @@ def render_library_page():
             disabled=df.empty
         )
     
-    df = read_sheets_data(sheets_service)
-    
     if df.empty:
         st.info("📭 No recordings yet. Go to the Record page to create your first transcription!")
         return
@@ -1434,8 +3796,13 @@ def render_library_page():
     with col2:
         if config.ENABLE_SEARCH:
             search_term = st.text_input("Search titles", "")
+            search_transcripts_too = config.ENABLE_TRANSCRIPT_SEARCH and st.checkbox(
+                "Search transcripts", key="library_transcript_search",
+                help='Use "quotes" for phrases and word* for prefixes'
+            )
         else:
             search_term = ""
+            search_transcripts_too = False
     
     with col3:
         sort_by = st.selectbox(
@@ -1443,41 +3810,26 @@ def render_library_page():
             ["Newest First", "Oldest First", "Title A-Z", "Title Z-A", "Most Words"]
         )
 
-    # Apply Filters
-    filtered_df = df.copy()
-    
-    if category_filter:
-        filtered_df = filtered_df[filtered_df['Category'].isin(category_filter)]
-    
-    if search_term:
-        filtered_df = filtered_df[
-            filtered_df['Title'].str.contains(search_term, case=False, na=False)
-        ]
-    
-    # Apply Sorting
-    if sort_by == "Newest First":
-        filtered_df = filtered_df.sort_values('Timestamp', ascending=False)
-    elif sort_by == "Oldest First":
-        filtered_df = filtered_df.sort_values('Timestamp', ascending=True)
-    elif sort_by == "Title A-Z":
-        filtered_df = filtered_df.sort_values('Title', ascending=True)
-    elif sort_by == "Title Z-A":
-        filtered_df = filtered_df.sort_values('Title', ascending=False)
-    elif sort_by == "Most Words":
-        try:
-            filtered_df['Words_Num'] = filtered_df['Words'].astype(str).str.replace(',', '').replace('', '0')
-            filtered_df['Words_Num'] = pd.to_numeric(filtered_df['Words_Num'], errors='coerce').fillna(0)
-            filtered_df = filtered_df.sort_values('Words_Num', ascending=False)
-        except:
-            pass
+    # Apply Filters & Sorting
+    if search_transcripts_too and search_term:
+        pending = backfill_transcript_index(df)
+        # Transcript matches are ordered by relevance rather than sort_by
+        filtered_df = search_transcripts(query_recordings(df, category_filter), search_term)
+    else:
+        pending = 0
+        filtered_df = query_recordings(df, category_filter, search_term, sort_by)
 
     # Results Summary
     st.write(f"**Showing {len(filtered_df)} of {len(df)} recordings**")
+    if pending:
+        st.caption(f"🔎 Indexing {pending} transcripts in the background — results will grow as they finish")
     
     # Display Recordings
     st.divider()
     
-    for idx, row in filtered_df.iterrows():
+    page_df = paginate(filtered_df, "library", view=(category_filter, search_term, sort_by, search_transcripts_too))
+    render_bulk_actions(page_df, sheets_service, key="library")
+    for idx, row in page_df.iterrows():
         render_recording_card_library(row, sheets_service, drive_service)
 
 def render_recording_card_library(row, sheets_service, drive_service):
@@ -1497,11 +3849,18 @@ def render_recording_card_library(row, sheets_service, drive_service):
         col3.write(f"**⏱️ Duration:** {row.get('Duration', 'N/A')}")
         col4.write(f"**📁 File:** {row.get('Filename', 'N/A')}")
         
+        drive_summary = cached_drive_file_summary(row.get('File ID'))
+        if drive_summary:
+            st.caption(drive_summary)
+        
+        if row.get('Snippet'):
+            st.markdown(f"> {highlight_snippet(row['Snippet'])}", unsafe_allow_html=True)
+        
         st.divider()
         
         # Audio player inline
         if row.get('Drive Link') and row['Drive Link'].strip():
-            play_audio_inline(row['Drive Link'], drive_service, row['Title'])
+            play_audio_on_demand(row['Drive Link'], drive_service, row['Title'], key=f"lib_{row['Key']}")
             st.divider()
         
         # Action Links
@@ -1527,17 +3886,15 @@ def render_recording_card_library(row, sheets_service, drive_service):
                 )
         
         with btn_col3:
-            if st.button(f"✏️ Edit", key=f"edit_{row['Row']}", use_container_width=True):
+            if st.button(f"✏️ Edit", key=f"edit_{row['Key']}", use_container_width=True):
                 st.session_state.edit_mode = True
-                st.session_state.edit_row = row['Row']
+                st.session_state.edit_key = row['Key']
                 st.rerun()
         
         with btn_col4:
-            if st.button(f"🗑️ Delete", key=f"del_{row['Row']}", use_container_width=True, type="secondary"):
-                if delete_sheet_row(sheets_service, row['Row']):
+            if st.button(f"🗑️ Delete", key=f"del_{row['Key']}", use_container_width=True, type="secondary"):
+                if delete_sheet_row(sheets_service, row['Row'], sheet_row_values(row)):
                     st.success(f"✅ Deleted!")
-                    st.cache_resource.clear()
-                    st.cache_data.clear()
                     st.rerun()
 
 # =========================
@@ -1556,65 +3913,50 @@ def render_analytics_page():
         st.stop()
     
     with st.spinner("Loading analytics..."):
-        df = read_sheets_data(sheets_service)
+        df = get_recordings_snapshot(sheets_service)
     
     if df.empty:
         st.info("📭 No data yet for analytics")
         return
     
+    metrics = get_recording_metrics(df)
+    
     # Summary metrics
     st.subheader("📊 Summary Statistics")
     col1, col2, col3, col4, col5 = st.columns(5)
     
     with col1:
-        st.metric("Total Recordings", len(df))
+        st.metric("Total Recordings", metrics["total"])
     
     with col2:
-        if 'Words' in df.columns:
-            try:
-                total_words = df['Words'].astype(str).str.replace(',', '').replace('', '0')
-                total_words = pd.to_numeric(total_words, errors='coerce').fillna(0).sum()
-                st.metric("Total Words", f"{int(total_words):,}")
-            except:
-                st.metric("Total Words", "N/A")
+        st.metric("Total Words", f"{metrics['total_words']:,}")
     
     with col3:
-        if 'Words' in df.columns:
-            try:
-                words = df['Words'].astype(str).str.replace(',', '').replace('', '0')
-                words = pd.to_numeric(words, errors='coerce').fillna(0)
-                avg_words = int(words.mean())
-                st.metric("Avg Words", f"{avg_words:,}")
-            except:
-                pass
+        st.metric("Avg Words", f"{metrics['avg_words']:,}")
     
     with col4:
-        if 'Category' in df.columns:
-            most_common = df['Category'].value_counts().idxmax()
-            st.metric("Most Common", most_common)
+        st.metric("Most Common", metrics["most_common_category"])
     
     with col5:
-        try:
-            from datetime import timedelta
-            week_ago = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
-            week_count = df['Timestamp'].apply(lambda x: x >= week_ago if isinstance(x, str) else False).sum()
-            st.metric("This Week", week_count)
-        except:
-            pass
+        st.metric("This Week", metrics["this_week"])
     
     st.divider()
     
     # Time-based analysis
     st.subheader("📅 Timeline Analysis")
     
-    if 'Timestamp' in df.columns:
-        try:
-            df['Date'] = pd.to_datetime(df['Timestamp'], errors='coerce').dt.date
-            daily_counts = df.groupby('Date').size().reset_index(name='Count')
-            
-            st.line_chart(daily_counts.set_index('Date'), height=300)
-        except:
-            st.info("Timeline data not available")
+    col1, col2 = st.columns(2)
+    with col1:
+        grain = st.radio("Group by", list(ROLLUP_GRAINS), horizontal=True, key="timeline_grain")
+    with col2:
+        measure = st.radio("Show", ["Count", "Words", "Duration (min)"], horizontal=True, key="timeline_measure")
+    
+    timeline, category_stats = get_recording_rollups(df, ROLLUP_GRAINS[grain])
+    
+    if timeline.empty:
+        st.info("Timeline data not available")
+    else:
+        st.line_chart(timeline[[measure]], height=300)
     
     st.divider()
     
@@ -1624,18 +3966,12 @@ def render_analytics_page():
     with col1:
         st.subheader("📊 Category Breakdown")
         if 'Category' in df.columns:
-            category_data = df['Category'].value_counts()
-            st.bar_chart(category_data, height=400)
+            st.bar_chart(metrics["category_counts"], height=400)
     
     with col2:
         st.subheader("📈 Word Count by Recording")
         if 'Words' in df.columns:
-            try:
-                words = df['Words'].astype(str).str.replace(',', '').replace('', '0')
-                words = pd.to_numeric(words, errors='coerce').fillna(0)
-                st.bar_chart(words, height=400)
-            except:
-                st.info("Word count data not available")
+            st.bar_chart(df['Word Count'], height=400)
     
     st.divider()
     
@@ -1643,10 +3979,7 @@ def render_analytics_page():
     st.subheader("🏆 Top 10 Longest Recordings")
     if 'Words' in df.columns:
         try:
-            df_sorted = df.copy()
-            df_sorted['Words_Num'] = df_sorted['Words'].astype(str).str.replace(',', '').replace('', '0')
-            df_sorted['Words_Num'] = pd.to_numeric(df_sorted['Words_Num'], errors='coerce').fillna(0)
-            top_10 = df_sorted.nlargest(10, 'Words_Num')[['Title', 'Category', 'Words', 'Duration', 'Timestamp']]
+            top_10 = df.nlargest(10, 'Word Count')[['Title', 'Category', 'Words', 'Duration', 'Timestamp']]
             
             st.dataframe(
                 top_10,
@@ -1663,17 +3996,6 @@ def render_analytics_page():
     st.subheader("📂 Category Insights")
     if 'Category' in df.columns and 'Words' in df.columns:
         try:
-            df_analysis = df.copy()
-            df_analysis['Words_Num'] = df_analysis['Words'].astype(str).str.replace(',', '').replace('', '0')
-            df_analysis['Words_Num'] = pd.to_numeric(df_analysis['Words_Num'], errors='coerce').fillna(0)
-            
-            category_stats = df_analysis.groupby('Category').agg({
-                'Title': 'count',
-                'Words_Num': ['sum', 'mean']
-            }).round(0)
-            
-            category_stats.columns = ['Count', 'Total Words', 'Avg Words']
-            
             st.dataframe(
                 category_stats,
                 use_container_width=True,
@@ -1701,6 +4023,7 @@ def render_footer():
 # =========================
 def main():
     """Main application logic"""
+    prefetch_page_data()
     render_sidebar()
     
     if st.session_state.page == "Dashboard":
@@ -9,6 +9,41 @@ N8N_WEBHOOK_URL = (
     "https://agentonline-u29564.vm.elestio.app/webhook-test/"
     "60bbcc46-60c2-484f-a51e-aa0067070f68"
 )
+# How audio is sent to the webhook:
+#   "json"      - base64 audioData inside a JSON body (what the workflow reads today)
+#   "multipart" - streamed multipart/form-data, audio in the "audio" part
+#   "binary"    - raw audio request body, metadata in the query string
+# Switch to "multipart" or "binary" only once the n8n workflow accepts them.
+WEBHOOK_TRANSFER_MODE = "json"
+# Pooled keep-alive HTTP client for the webhook. Connection errors and the
+# statuses below are retried with exponential backoff and full jitter.
+WEBHOOK_POOL_SIZE = 16
+WEBHOOK_CONNECT_TIMEOUT = 10  # seconds
+WEBHOOK_READ_TIMEOUT = None  # no read timeout: long audio can take a long time
+WEBHOOK_MAX_RETRIES = 4
+WEBHOOK_RETRY_STATUSES = (429, 500, 502, 503, 504)
+WEBHOOK_BACKOFF_BASE = 1.0  # seconds
+WEBHOOK_BACKOFF_MAX = 30.0  # seconds
+# Background transcription jobs (records and spooled audio live in JOBS_DIR)
+JOBS_DIR = ".jobs"
+TRANSCRIPTION_WORKERS = 4
+JOB_POLL_INTERVAL = 2  # seconds between status refreshes on the Record page
+JOB_RETENTION = 7 * 24 * 3600  # seconds a finished job record (and its transcript) is kept
+# Long WAV recordings are cut at the quietest point near each boundary into
+# overlapping segments that are transcribed in parallel and stitched back
+# together. Segments go to SEGMENT_WEBHOOK_URL, which must only transcribe
+# and return {"transcription": ...}; every segment request carries jobId,
+# segmentIndex, segmentCount and segmentOffset (seconds). The full recording
+# is then sent once to N8N_WEBHOOK_URL with the stitched text in a
+# "transcription" field so the webhook can store it without transcribing.
+# Requires the json or multipart transfer mode.
+ENABLE_SEGMENTED_TRANSCRIPTION = False
+SEGMENT_WEBHOOK_URL = ""  # transcription-only endpoint; segmentation stays off while empty
+SEGMENT_MIN_SECONDS = 20 * 60  # only split recordings longer than this
+SEGMENT_SECONDS = 10 * 60
+SEGMENT_OVERLAP_SECONDS = 5
+SEGMENT_SILENCE_SEARCH_SECONDS = 30
+SEGMENT_WORKERS = 4
 # =========================
 # GOOGLE SHEETS CONFIGURATION
 # =========================
@@ -87,13 +122,71 @@ ENABLE_DASHBOARD = True
 ENABLE_AUDIO_PLAYBACK = True
 ENABLE_CATEGORY_FILTER = True
 ENABLE_SEARCH = True
+# Card views fetch audio from Drive only after a per-card "Load & Play" click
+LAZY_AUDIO_LOADING = True
 # =========================
 # ADVANCED SETTINGS
 # =========================
-REQUEST_TIMEOUT = None  # No timeout for long audio
+REQUEST_TIMEOUT = (WEBHOOK_CONNECT_TIMEOUT, WEBHOOK_READ_TIMEOUT)  # (connect, read)
 GOOGLE_SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
     "https://www.googleapis.com/auth/drive.file",
 ]
 CACHE_TTL = 300
-RECORDINGS_PER_PAGE = 50
+# Google clients are built once per credentials from discovery documents kept
+# in DISCOVERY_CACHE_DIR, and their access token is refreshed in the
+# background TOKEN_REFRESH_MARGIN seconds before it expires.
+DISCOVERY_CACHE_DIR = ".discovery_cache"
+TOKEN_REFRESH_MARGIN = 300  # seconds
+TOKEN_REFRESH_RETRY = 30  # seconds between attempts after a failed refresh
+# Clients are shared by every session; each HTTP call borrows one of at most
+# this many authorized keep-alive connections.
+GOOGLE_HTTP_POOL_SIZE = 16
+# The sheet is only re-downloaded when its Drive revision changes. The probe
+# runs at most once per interval (needs Drive read access to the spreadsheet;
+# without it, snapshots simply expire every CACHE_TTL seconds).
+SHEET_PROBE_INTERVAL = 30  # seconds
+SNAPSHOT_CACHE_ENTRIES = 8
+FETCH_WORKERS = 8  # concurrent Google API reads when a page loads
+# Every Sheets/Drive call goes through a token bucket per API, sized to the
+# project's per-user quota as (requests per minute, burst). Interactive calls
+# go ahead of bulk ones (mirror syncs, transcript backfills), which may only
+# draw the bucket down to GOOGLE_API_BULK_RESERVE of its burst. 429s, 403
+# rate-limit errors and the statuses below are retried with exponential
+# backoff and full jitter; writes only retry outright quota rejections.
+GOOGLE_API_QUOTAS = {
+    "sheets": (60, 10),
+    "drive": (12000, 100),
+}
+GOOGLE_API_BULK_RESERVE = 0.5
+GOOGLE_API_RETRY_STATUSES = (429, 503)
+GOOGLE_API_MAX_RETRIES = 3
+GOOGLE_API_BULK_MAX_RETRIES = 8
+GOOGLE_API_BACKOFF_BASE = 1.0  # seconds
+GOOGLE_API_BACKOFF_MAX = 32.0  # seconds
+DRIVE_METADATA_TTL = 3600  # seconds Drive size/type/duration lookups are reused
+# Local SQLite mirror of the Recordings tab, synced in the background.
+# Pages read from the mirror; writes go to Sheets first, then to the mirror.
+ENABLE_SHEET_MIRROR = True
+MIRROR_DIR = ".mirror"
+MIRROR_SYNC_INTERVAL = 60  # seconds between background syncs
+# Full-text transcript search (SQLite FTS5). Finished transcriptions are
+# indexed as they arrive; older transcripts are exported from their Docs.
+ENABLE_TRANSCRIPT_SEARCH = True
+TRANSCRIPT_INDEX_PATH = ".mirror/transcripts.sqlite3"
+TRANSCRIPT_SEARCH_LIMIT = 50
+TRANSCRIPT_SNIPPET_TOKENS = 24  # words of context around each match
+# On-disk LRU cache of downloaded Drive audio, kept across restarts
+AUDIO_CACHE_DIR = ".audio_cache"
+AUDIO_CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024  # 2 GB
+# Local byte-range proxy the audio player streams from. Off by default: the
+# browser must be able to reach AUDIO_STREAM_PUBLIC_URL, so set it to the
+# proxy's externally visible address (an https URL behind a reverse proxy
+# when the app itself is served over https). Without it, audio is
+# downloaded and embedded as before.
+ENABLE_AUDIO_STREAMING = False
+AUDIO_STREAM_HOST = "127.0.0.1"
+AUDIO_STREAM_PORT = 8502
+AUDIO_STREAM_PUBLIC_URL = ""  # e.g. "https://audio.example.com"
+AUDIO_STREAM_CHUNK_BYTES = 1024 * 1024  # 1 MB per ranged Drive read
+RECORDINGS_PER_PAGE = 50  # cards/playlist entries rendered per page